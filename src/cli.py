@@ -15,14 +15,15 @@ from rich.syntax import Syntax
 
 from src.core import ExtractionService
 from src.core.exceptions import ContextualExtractionError
+from src.core.interfaces import ContentExtractor
 from src.core.models import ExtractionResult
 from src.infrastructure import (
-    AsyncHttpClient,
-    BeautifulSoupLinkParser,
     ContextAwareClassifier,
     LocalFileStorage,
     OutputFormat,
     OutputFormatters,
+    create_content_extractor,
+    create_link_parser,
 )
 from src.logging import setup_logging
 from src.settings import settings
@@ -269,6 +270,8 @@ def serve_command(
         port=port,
         reload=reload,
         log_level="debug" if verbose else "info",
+        # The app's log_requests middleware already logs every request
+        access_log=False,
     )
 
 
@@ -289,79 +292,94 @@ def version_command() -> None:
 async def _extract(url: str, save_result: bool = False) -> ExtractionResult:
     """Helper function to perform extraction"""
     # Create components
-    http_client = AsyncHttpClient()
-    link_parser = BeautifulSoupLinkParser()
+    http_client = create_content_extractor()
+    link_parser = create_link_parser()
     link_classifier = ContextAwareClassifier()  # New implementation
     storage = LocalFileStorage()
 
-    # Ensure output directory exists
-    output_dir = Path("output")
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Fetch content and save raw HTML for inspection
-    logger.debug("attempting_to_fetch_raw_html", url=url)
-    # The 'get' method should be part of ContentExtractor interface if used,
-    # but AsyncHttpClient implements ContentExtractor, which has extract_content
-    # It seems 'get' is an internal method or not part of the protocol.
-    # Let's use extract_content instead, which is part of the ContentExtractor protocol.
-    raw_html_content = await http_client.extract_content(url)
-    raw_html_path = output_dir / "raw_page_content.html"
-    raw_html_path.write_text(raw_html_content)
-    logger.info("raw_html_saved_successfully", path=str(raw_html_path), url=url)
-
-    # Create service
-    service = ExtractionService(
-        content_extractor=http_client,
-        link_parser=link_parser,
-        link_classifier=link_classifier,
-        result_storage=storage if save_result else None,
-    )
+    try:
+        # Ensure output directory exists
+        output_dir = Path("output")
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Fetch content and save raw HTML for inspection
+        logger.debug("attempting_to_fetch_raw_html", url=url)
+        # The 'get' method should be part of ContentExtractor interface if used,
+        # but AsyncHttpClient implements ContentExtractor, which has extract_content
+        # It seems 'get' is an internal method or not part of the protocol.
+        # Let's use extract_content instead, which is part of the ContentExtractor protocol.
+        raw_html_content = await http_client.extract_content(url)
+        raw_html_path = output_dir / "raw_page_content.html"
+        raw_html_path.write_text(raw_html_content)
+        logger.info("raw_html_saved_successfully", path=str(raw_html_path), url=url)
+
+        # Create service
+        service = ExtractionService(
+            content_extractor=http_client,
+            link_parser=link_parser,
+            link_classifier=link_classifier,
+            result_storage=storage if save_result else None,
+        )
 
-    # Perform extraction
-    result, _ = await service.extract_and_classify(
-        url, save_result
-    )  # Unpack result and ignore content
+        # Perform extraction
+        result, _ = await service.extract_and_classify(
+            url, save_result, keep_content=False
+        )  # Unpack result and ignore content
 
-    # Handle assets after extraction completed
-    await _handle_assets(result, http_client, output_dir)
+        # Handle assets after extraction completed
+        await _handle_assets(result, http_client, output_dir)
 
-    return result
+        return result
+    finally:
+        # Release the pooled connections (and aiohttp's session)
+        await _close_http_client(http_client)
 
 
 async def _crawl(url: str, max_pages: int) -> ExtractionResult:
     """Helper function to perform multi-page crawling"""
     # Create components
-    http_client = AsyncHttpClient()
-    link_parser = BeautifulSoupLinkParser()
+    http_client = create_content_extractor()
+    link_parser = create_link_parser()
     link_classifier = ContextAwareClassifier()
     storage = LocalFileStorage()
 
-    # Ensure output directory exists
-    output_dir = Path("output")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        # Ensure output directory exists
+        output_dir = Path("output")
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Fetch content and save raw HTML for inspection
+        logger.debug("attempting_to_fetch_raw_html", url=url)
+        raw_html_content = await http_client.extract_content(url)
+        raw_html_path = output_dir / "raw_page_content.html"
+        raw_html_path.write_text(raw_html_content)
+        logger.info("raw_html_saved_successfully", path=str(raw_html_path), url=url)
+
+        # Create service
+        service = ExtractionService(
+            content_extractor=http_client,
+            link_parser=link_parser,
+            link_classifier=link_classifier,
+            result_storage=storage,
+        )
 
-    # Fetch content and save raw HTML for inspection
-    logger.debug("attempting_to_fetch_raw_html", url=url)
-    raw_html_content = await http_client.extract_content(url)
-    raw_html_path = output_dir / "raw_page_content.html"
-    raw_html_path.write_text(raw_html_content)
-    logger.info("raw_html_saved_successfully", path=str(raw_html_path), url=url)
-
-    # Create service
-    service = ExtractionService(
-        content_extractor=http_client,
-        link_parser=link_parser,
-        link_classifier=link_classifier,
-        result_storage=storage,
-    )
+        # Perform crawling
+        result = await service.crawl_and_extract(url, max_pages)
+
+        # Handle assets for aggregated result
+        await _handle_assets(result, http_client, output_dir)
 
-    # Perform crawling
-    result = await service.crawl_and_extract(url, max_pages)
+        return result
+    finally:
+        # Release the pooled connections (and aiohttp's session)
+        await _close_http_client(http_client)
 
-    # Handle assets for aggregated result
-    await _handle_assets(result, http_client, output_dir)
 
-    return result
+async def _close_http_client(http_client: ContentExtractor) -> None:
+    """Close the HTTP client's shared pool if the backend has one."""
+    aclose = getattr(http_client, "aclose", None)
+    if aclose is not None:
+        await aclose()
 
 
 # ---------------------------------------------------------------------------
@@ -370,7 +388,7 @@ async def _crawl(url: str, max_pages: int) -> ExtractionResult:
 
 
 async def _handle_assets(
-    result: ExtractionResult, http_client: AsyncHttpClient, output_dir: Path
+    result: ExtractionResult, http_client: ContentExtractor, output_dir: Path
 ) -> None:
     """Download PDFs and write YouTube link JSON for a given extraction result."""
 
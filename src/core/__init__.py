@@ -12,7 +12,13 @@ from .exceptions import (
     ResultStorageError,
 )
 from .interfaces import LinkClassifier, LinkParser
-from .models import ExtractedLink, ExtractionMetadata, ExtractionResult, LinkType
+from .models import (
+    ExtractedLink,
+    ExtractionMetadata,
+    ExtractionResult,
+    LinkType,
+    bucket_by_type,
+)
 from .service import ExtractionService
 from .value_objects import CorrelationId, ProcessingTime, SourceUrl
 
@@ -21,6 +27,7 @@ __all__ = [
     "ExtractedLink",
     "ExtractionMetadata",
     "ExtractionResult",
+    "bucket_by_type",
     "SourceUrl",
     "ProcessingTime",
     "CorrelationId",
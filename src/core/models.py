@@ -70,16 +70,14 @@ class ExtractedLink(BaseModel):
     def create_pdf_link(cls, url: str, text: str) -> "ExtractedLink":
         """Create PDF link with validation."""
         # Removed URL pattern validation as classification is handled externally
-        return cls(
-            url=HttpUrl(url), link_text=text or "PDF Document", link_type=LinkType.PDF
-        )
+        return cls(url=url, link_text=text or "PDF Document", link_type=LinkType.PDF)
 
     @classmethod
     def create_youtube_link(cls, url: str, text: str) -> "ExtractedLink":
         """Create YouTube link with validation."""
         # Removed URL pattern validation as classification is handled externally
         return cls(
-            url=HttpUrl(url),
+            url=url,
             link_text=text or "YouTube Video",
             link_type=LinkType.YOUTUBE,
         )
@@ -87,7 +85,17 @@ class ExtractedLink(BaseModel):
     @classmethod
     def create_other_link(cls, url: str, text: str) -> "ExtractedLink":
         """Create generic link."""
-        return cls(url=HttpUrl(url), link_text=text or url, link_type=LinkType.OTHER)
+        return cls(url=url, link_text=text or url, link_type=LinkType.OTHER)
+
+
+def bucket_by_type(links: list[ExtractedLink]) -> dict[LinkType, list[ExtractedLink]]:
+    """Group links by type in a single pass, preserving their order."""
+    buckets: dict[LinkType, list[ExtractedLink]] = {
+        link_type: [] for link_type in LinkType
+    }
+    for link in links:
+        buckets[link.link_type].append(link)
+    return buckets
 
 
 class ExtractionMetadata(BaseModel):
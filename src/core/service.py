@@ -2,13 +2,14 @@
 Core extraction service that orchestrates the extraction process.
 """
 
+import time
 from datetime import datetime
 
 import structlog
 
 from .exceptions import ContextualExtractionError, ExtractionContext
 from .interfaces import ContentExtractor, LinkClassifier, LinkParser, ResultStorage
-from .models import ExtractionMetadata, ExtractionResult, LinkType
+from .models import ExtractionMetadata, ExtractionResult, LinkType, bucket_by_type
 from .value_objects import CorrelationId, ProcessingTime, SourceUrl
 
 logger = structlog.get_logger()
@@ -32,12 +33,16 @@ class ExtractionService:
         self._result_storage = result_storage
 
     async def extract_and_classify(
-        self, url: str, save_result: bool = False
+        self, url: str, save_result: bool = False, keep_content: bool = True
     ) -> tuple[ExtractionResult, str]:
         """
         Main extraction workflow with enhanced error context.
+
+        With ``keep_content=False`` the raw HTML is released as soon as links
+        are parsed and an empty string is returned in its place.
         """
         # Create extraction context
+        start = time.perf_counter()
         correlation_id = CorrelationId.generate()
         context = ExtractionContext(
             url=url, correlation_id=correlation_id, start_time=datetime.now()
@@ -63,6 +68,14 @@ class ExtractionService:
                 link_count=len(raw_links),
                 correlation_id=str(correlation_id),
             )
+            if not keep_content:
+                content = ""
+                # The parser may still hold the page for find_navigation_links
+                clear_parse_cache = getattr(
+                    self._link_parser, "clear_parse_cache", None
+                )
+                if clear_parse_cache is not None:
+                    clear_parse_cache()
 
             # Step 3: Classify links
             classified_links = self._link_classifier.classify_links(raw_links)
@@ -74,18 +87,13 @@ class ExtractionService:
             )
 
             # Step 4: Create result
-            processing_time = ProcessingTime(context.get_elapsed_time())
+            processing_time = ProcessingTime(time.perf_counter() - start)
 
             # Sort links by type
-            pdf_links = [
-                link for link in classified_links if link.link_type == LinkType.PDF
-            ]
-            youtube_links = [
-                link for link in classified_links if link.link_type == LinkType.YOUTUBE
-            ]
-            other_links = [
-                link for link in classified_links if link.link_type == LinkType.OTHER
-            ]
+            buckets = bucket_by_type(classified_links)
+            pdf_links = buckets[LinkType.PDF]
+            youtube_links = buckets[LinkType.YOUTUBE]
+            other_links = buckets[LinkType.OTHER]
 
             metadata = ExtractionMetadata(
                 total_links_found=len(classified_links),
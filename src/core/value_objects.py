@@ -1,6 +1,7 @@
 """
 Value objects for domain-driven design.
 """
+import secrets
 from dataclasses import dataclass
 
 from pydantic import HttpUrl
@@ -77,10 +78,8 @@ class CorrelationId:
 
     @classmethod
     def generate(cls) -> "CorrelationId":
-        """Generate a new correlation ID."""
-        import uuid
-
-        return cls(str(uuid.uuid4())[:8])
+        """Generate a new correlation ID (8 random hex characters)."""
+        return cls(secrets.token_hex(4))
 
     def __str__(self) -> str:
         return self.value
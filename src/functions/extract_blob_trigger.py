@@ -2,19 +2,13 @@
 Azure Function Blob trigger for batch web content extraction.
 """
 import json
-import os
 import time
 
 import azure.functions as func
+import orjson
 import structlog
 
-from src.core import ExtractionService
-from src.infrastructure import (
-    AsyncHttpClient,
-    BeautifulSoupLinkParser,
-    RegexLinkClassifier,
-)
-from src.infrastructure.cloud_storage import AzureBlobStorage
+from src.functions.shared import get_service, serialize_link
 from src.logging import setup_logging
 
 # Configure structured logging
@@ -34,12 +28,11 @@ async def main(blob: func.InputStream, outputBlob: func.Out[str]) -> None:
         outputBlob (func.Out[str]): The output blob
     """
     logger.info("blob_trigger_invoked", blob_name=blob.name)
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
-        # Read and parse blob content
-        blob_content = blob.read().decode("utf-8")
-        urls_data = json.loads(blob_content)
+        # Parse the raw bytes directly, skipping an intermediate str copy
+        urls_data = orjson.loads(blob.read())
 
         # Ensure we have a list of URLs
         if not isinstance(urls_data, list):
@@ -67,26 +60,7 @@ async def main(blob: func.InputStream, outputBlob: func.Out[str]) -> None:
 
         logger.info("processing_urls", count=len(urls), blob_name=blob.name)
 
-        # Set up components
-        http_client = AsyncHttpClient()
-        link_parser = BeautifulSoupLinkParser()
-        link_classifier = RegexLinkClassifier()
-
-        # Set up storage
-        try:
-            connection_string = os.environ.get("AzureWebJobsStorage")
-            storage = AzureBlobStorage(connection_string=connection_string)
-        except Exception as e:
-            logger.warning("storage_initialization_failed", error=str(e))
-            storage = None
-
-        # Create service
-        service = ExtractionService(
-            content_extractor=http_client,
-            link_parser=link_parser,
-            link_classifier=link_classifier,
-            result_storage=storage,
-        )
+        service = get_service(with_storage=True)
 
         # Process each URL
         results = []
@@ -95,7 +69,9 @@ async def main(blob: func.InputStream, outputBlob: func.Out[str]) -> None:
         for url in urls:
             try:
                 # Extract content
-                result = await service.extract_and_classify(url, True)
+                result, _ = await service.extract_and_classify(
+                    url, True, keep_content=False
+                )
 
                 # Format result
                 result_data = {
@@ -105,9 +81,11 @@ async def main(blob: func.InputStream, outputBlob: func.Out[str]) -> None:
                     "youtube_count": len(result.youtube_links),
                     "other_count": len(result.other_links),
                     "links": {
-                        "pdf": [link.model_dump() for link in result.pdf_links],
-                        "youtube": [link.model_dump() for link in result.youtube_links],
-                        "other": [link.model_dump() for link in result.other_links],
+                        "pdf": [serialize_link(link) for link in result.pdf_links],
+                        "youtube": [
+                            serialize_link(link) for link in result.youtube_links
+                        ],
+                        "other": [serialize_link(link) for link in result.other_links],
                     },
                 }
 
@@ -119,12 +97,13 @@ async def main(blob: func.InputStream, outputBlob: func.Out[str]) -> None:
                 errors.append({"url": url, "error": str(e)})
 
         # Create output
+        processing_time = time.perf_counter() - start_time
         output = {
             "processed_count": len(results),
             "error_count": len(errors),
             "results": results,
             "errors": errors,
-            "processing_time_seconds": time.time() - start_time,
+            "processing_time_seconds": processing_time,
         }
 
         # Write output blob
@@ -134,7 +113,7 @@ async def main(blob: func.InputStream, outputBlob: func.Out[str]) -> None:
             "blob_processing_completed",
             processed_count=len(results),
             error_count=len(errors),
-            processing_time=f"{time.time() - start_time:.2f}s",
+            processing_time=f"{processing_time:.2f}s",
         )
 
     except Exception as e:
@@ -144,7 +123,7 @@ async def main(blob: func.InputStream, outputBlob: func.Out[str]) -> None:
                 {
                     "error": str(e),
                     "blob_name": blob.name,
-                    "processing_time_seconds": time.time() - start_time,
+                    "processing_time_seconds": time.perf_counter() - start_time,
                 }
             )
         )
@@ -2,19 +2,12 @@
 Azure Function HTTP trigger for web content extraction.
 """
 import json
-import os
 import time
 
 import azure.functions as func
 import structlog
 
-from src.core import ExtractionService
-from src.infrastructure import (
-    AsyncHttpClient,
-    BeautifulSoupLinkParser,
-    RegexLinkClassifier,
-)
-from src.infrastructure.cloud_storage import AzureBlobStorage
+from src.functions.shared import get_service, serialize_link
 from src.logging import setup_logging
 
 # Configure structured logging
@@ -33,13 +26,13 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
         func.HttpResponse: The HTTP response
     """
     logger.info("function_invoked")
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         # Parse request
         req_body = req.get_json() if req.get_body() else {"url": None}
         url = req_body.get("url") or req.params.get("url")
-        save_result = req_body.get("save_result", True)
+        save_result = bool(req_body.get("save_result", True))
 
         # Validate URL
         if not url:
@@ -51,30 +44,12 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
 
         logger.info("processing_url", url=url)
 
-        # Set up components
-        http_client = AsyncHttpClient()
-        link_parser = BeautifulSoupLinkParser()
-        link_classifier = RegexLinkClassifier()
-
-        # Set up storage
-        storage = None
-        if save_result:
-            try:
-                connection_string = os.environ.get("AzureWebJobsStorage")
-                storage = AzureBlobStorage(connection_string=connection_string)
-            except Exception as e:
-                logger.warning("storage_initialization_failed", error=str(e))
-
-        # Create service and extract content
-        service = ExtractionService(
-            content_extractor=http_client,
-            link_parser=link_parser,
-            link_classifier=link_classifier,
-            result_storage=storage,
-        )
+        service = get_service(with_storage=save_result)
 
         # Run extraction
-        result = await service.extract_and_classify(url, save_result)
+        result, _ = await service.extract_and_classify(
+            url, save_result, keep_content=False
+        )
 
         # Format response
         response = {
@@ -87,13 +62,13 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
             if result.metadata
             else 0,
             "links": {
-                "pdf": [link.model_dump() for link in result.pdf_links],
-                "youtube": [link.model_dump() for link in result.youtube_links],
-                "other": [link.model_dump() for link in result.other_links],
+                "pdf": [serialize_link(link) for link in result.pdf_links],
+                "youtube": [serialize_link(link) for link in result.youtube_links],
+                "other": [serialize_link(link) for link in result.other_links],
             },
         }
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         logger.info(
             "function_completed",
             url=url,
@@ -104,7 +79,7 @@ async def main(req: func.HttpRequest) -> func.HttpResponse:
         return func.HttpResponse(json.dumps(response), mimetype="application/json")
 
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         logger.error(
             "function_failed", error=str(e), processing_time=f"{processing_time:.4f}s"
         )
@@ -0,0 +1,96 @@
+"""
+Resources shared by the Azure Function triggers on a warm worker.
+"""
+import asyncio
+import atexit
+import os
+from typing import Any
+
+import structlog
+
+from src.core import ExtractedLink, ExtractionService
+from src.core.interfaces import ContentExtractor, LinkClassifier, LinkParser
+from src.infrastructure import (
+    RegexLinkClassifier,
+    create_content_extractor,
+    create_link_parser,
+)
+from src.infrastructure.cloud_storage import AzureBlobStorage, close_container_clients
+
+logger = structlog.get_logger(__name__)
+
+# Built on first use and reused across invocations so warm workers keep
+# their HTTP and blob connection pools
+_components: tuple[ContentExtractor, LinkParser, LinkClassifier] | None = None
+_storage: AzureBlobStorage | None = None
+
+# Event loop the pooled clients are bound to, used to close them at exit
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_service(with_storage: bool) -> ExtractionService:
+    """
+    Build an extraction service from the worker's shared components.
+
+    Blob storage is only set up when ``with_storage`` is true, so requests
+    that don't persist results need no storage connection string.
+    """
+    global _components, _loop
+    if _components is None:
+        _components = (
+            create_content_extractor(),
+            create_link_parser(),
+            RegexLinkClassifier(),
+        )
+        _loop = asyncio.get_running_loop()
+        atexit.register(_close_shared_resources)
+
+    content_extractor, link_parser, link_classifier = _components
+    return ExtractionService(
+        content_extractor=content_extractor,
+        link_parser=link_parser,
+        link_classifier=link_classifier,
+        result_storage=_get_storage() if with_storage else None,
+    )
+
+
+def serialize_link(link: ExtractedLink) -> dict[str, Any]:
+    """Serialize a link to a JSON-ready dict without a pydantic model_dump."""
+    return {
+        "url": str(link.url),
+        "link_text": link.link_text,
+        "link_type": link.link_type.value,
+        "is_valid": link.is_valid,
+    }
+
+
+def _get_storage() -> AzureBlobStorage | None:
+    """Return the shared blob storage, or None if it can't be configured."""
+    global _storage
+    if _storage is None:
+        try:
+            connection_string = os.environ.get("AzureWebJobsStorage")
+            _storage = AzureBlobStorage(connection_string=connection_string)
+        except Exception as e:
+            logger.warning("storage_initialization_failed", error=str(e))
+    return _storage
+
+
+async def _aclose_shared_resources() -> None:
+    """Close the pooled HTTP client and blob container clients."""
+    if _components is not None:
+        aclose = getattr(_components[0], "aclose", None)
+        if aclose is not None:
+            await aclose()
+    await close_container_clients()
+
+
+def _close_shared_resources() -> None:
+    """Close pooled clients on their own event loop when the worker exits."""
+    loop = _loop
+    if loop is None or loop.is_closed() or loop.is_running():
+        return
+    try:
+        loop.run_until_complete(_aclose_shared_resources())
+    except Exception as e:
+        logger.warning("shared_resources_close_failed", error=str(e))
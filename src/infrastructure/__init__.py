@@ -3,8 +3,8 @@ Infrastructure implementations of core interfaces.
 """
 from .context_classifier import ContextAwareClassifier
 from .formatters import OutputFormat, OutputFormatters
-from .html_parser import BeautifulSoupLinkParser
-from .http_client import AsyncHttpClient
+from .html_parser import BeautifulSoupLinkParser, create_link_parser
+from .http_client import AsyncHttpClient, create_content_extractor
 from .link_classifier import RegexLinkClassifier
 from .local_storage import LocalFileStorage
 
@@ -16,8 +16,28 @@ __all__ = [
     "OutputFormat",
     "LocalFileStorage",
     "ContextAwareClassifier",
+    "create_link_parser",
+    "create_content_extractor",
 ]
 
+# Conditionally export AiohttpHttpClient only if aiohttp is available
+try:
+    from .aiohttp_client import AiohttpHttpClient
+
+    __all__.append("AiohttpHttpClient")
+except ImportError:
+    # aiohttp not installed
+    pass
+
+# Conditionally export LexborLinkParser only if selectolax is available
+try:
+    from .lexbor_parser import LexborLinkParser
+
+    __all__.append("LexborLinkParser")
+except ImportError:
+    # selectolax not installed
+    pass
+
 # Conditionally export AzureBlobStorage only if the package is available
 try:
     from .cloud_storage import AzureBlobStorage
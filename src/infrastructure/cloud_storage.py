@@ -1,11 +1,16 @@
 """
 Cloud storage implementation using Azure Blob Storage.
 """
+import asyncio
+import threading
+import weakref
 from datetime import datetime
 
 import azure.core.exceptions
+import orjson
 import structlog
-from azure.storage.blob import BlobServiceClient, ContentSettings
+from azure.storage.blob import ContentSettings
+from azure.storage.blob.aio import ContainerClient
 
 from src.core.exceptions import ResultStorageError
 from src.core.interfaces import ResultStorage
@@ -14,6 +19,49 @@ from src.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# Parallel block uploads for large results; small ones go up in a single put
+_UPLOAD_MAX_CONCURRENCY = 4
+
+# Uploads in flight at once when saving a batch of results
+_BATCH_UPLOAD_CONCURRENCY = 16
+
+_JSON_CONTENT_SETTINGS = ContentSettings(content_type="application/json")
+
+# One container client (and HTTP transport) per event loop and
+# account/container, shared by every AzureBlobStorage instance; the
+# transport binds to the loop it first runs on
+_container_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], ContainerClient]
+] = weakref.WeakKeyDictionary()
+_container_clients_lock = threading.Lock()
+
+# Pooled clients whose container is known to exist
+_ready_clients: weakref.WeakSet[ContainerClient] = weakref.WeakSet()
+
+
+def _get_container_client(
+    connection_string: str, container_name: str
+) -> ContainerClient:
+    """Return the pooled client for the running loop, creating it on first use."""
+    key = (connection_string, container_name)
+    with _container_clients_lock:
+        clients = _container_clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(key)
+        if client is None:
+            client = ContainerClient.from_connection_string(
+                connection_string, container_name
+            )
+            clients[key] = client
+        return client
+
+
+async def close_container_clients() -> None:
+    """Close the running loop's pooled container clients; call at shutdown."""
+    with _container_clients_lock:
+        clients = _container_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
 
 class AzureBlobStorage(ResultStorage):
     """
@@ -36,26 +84,39 @@ class AzureBlobStorage(ResultStorage):
             logger.warning("azure_storage_not_configured")
             raise ResultStorageError("Azure Storage connection string is not provided")
 
-        # Create blob service client and ensure container exists
+        # Pooled async clients are created per event loop on first upload, so
+        # construction never blocks on network I/O; building one here only
+        # validates the connection string
+        self._client_key = (self.connection_string, self.container_name)
         try:
-            self._blob_service_client = BlobServiceClient.from_connection_string(
-                self.connection_string
-            )
-            self._container_client = self._blob_service_client.get_container_client(
-                self.container_name
-            )
-
-            # Create container if it doesn't exist
-            if not self._container_client.exists():
-                logger.info("creating_container", container=self.container_name)
-                self._container_client.create_container()
-
+            ContainerClient.from_connection_string(*self._client_key)
         except Exception as e:
             logger.error("azure_storage_init_failed", error=str(e))
             raise ResultStorageError(
                 f"Failed to initialize Azure Blob Storage: {e}"
             ) from e
 
+    @property
+    def _container_client(self) -> ContainerClient:
+        """The running loop's pooled client, looked up per use"""
+        return _get_container_client(*self._client_key)
+
+    async def _ensure_container(self) -> None:
+        """Create the container on first use if it doesn't exist"""
+        client = self._container_client
+        # Checked once per pooled client, so a client replaced after
+        # close_container_clients() checks again
+        if client in _ready_clients:
+            return
+        if not await client.exists():
+            logger.info("creating_container", container=self.container_name)
+            try:
+                await client.create_container()
+            except azure.core.exceptions.ResourceExistsError:
+                # Created concurrently by another upload or process
+                pass
+        _ready_clients.add(client)
+
     async def save_result(
         self, result: ExtractionResult, filename: str | None = None
     ) -> str:
@@ -79,48 +140,88 @@ class AzureBlobStorage(ResultStorage):
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"extraction_{domain}_{timestamp}.json"
 
-            # Make sure filename has .json extension
-            if not filename.endswith(".json"):
-                filename += ".json"
-
-            # Convert result to JSON
-            result_json = result.model_dump_json(indent=2)
-
-            # Upload to blob storage
-            blob_client = self._container_client.get_blob_client(filename)
-
-            blob_client.upload_blob(
-                result_json,
-                overwrite=True,
-                content_settings=ContentSettings(content_type="application/json"),
-            )
-
-            # Get blob URL
-            blob_url = str(blob_client.url)
+            await self._ensure_container()
+            blob_name, blob_url, size = await self._upload_result(result, filename)
 
             logger.info(
                 "result_saved_to_azure",
                 container=self.container_name,
-                blob=filename,
-                size=len(result_json),
+                blob=blob_name,
+                size=size,
             )
 
             return blob_url
 
-        except azure.core.exceptions.ResourceExistsError:
-            # Handle case when blob already exists (unlikely with timestamp)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            if filename is not None:
-                new_filename = f"{filename.rsplit('.', 1)[0]}_{timestamp}.json"
-            else:
-                new_filename = f"extraction_unknown_{timestamp}.json"
-            logger.warning(
-                "blob_already_exists_retrying", original=filename, new=new_filename
-            )
-            return await self.save_result(result, new_filename)
-
         except Exception as e:
             logger.error("azure_save_failed", error=str(e))
             raise ResultStorageError(
                 f"Failed to save result to Azure Blob Storage: {e}"
             ) from e
+
+    async def save_results(self, results: list[ExtractionResult]) -> list[str]:
+        """
+        Save several extraction results concurrently.
+
+        Args:
+            results: The extraction results to save
+
+        Returns:
+            URLs of the saved blobs, in the same order as ``results``
+
+        Raises:
+            ResultStorageError: If any upload fails
+        """
+        semaphore = asyncio.Semaphore(_BATCH_UPLOAD_CONCURRENCY)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        async def upload(index: int, result: ExtractionResult) -> tuple[str, str, int]:
+            # Index suffix keeps names unique within the batch
+            domain = result.source_url.get_domain()
+            filename = f"extraction_{domain}_{timestamp}_{index}.json"
+            async with semaphore:
+                return await self._upload_result(result, filename)
+
+        try:
+            await self._ensure_container()
+            uploads = await asyncio.gather(
+                *(upload(i, result) for i, result in enumerate(results))
+            )
+        except Exception as e:
+            logger.error("azure_batch_save_failed", count=len(results), error=str(e))
+            raise ResultStorageError(
+                f"Failed to save results to Azure Blob Storage: {e}"
+            ) from e
+
+        logger.info(
+            "results_saved_to_azure",
+            container=self.container_name,
+            count=len(uploads),
+            size=sum(size for _, _, size in uploads),
+        )
+        return [blob_url for _, blob_url, _ in uploads]
+
+    async def _upload_result(
+        self, result: ExtractionResult, filename: str
+    ) -> tuple[str, str, int]:
+        """Upload one result, returning its blob name, URL and size in bytes"""
+        # Make sure filename has .json extension
+        if not filename.endswith(".json"):
+            filename += ".json"
+
+        # Compact UTF-8 JSON; blobs are read by machines, not humans. Unset
+        # optional fields (e.g. metadata, page_title) are left out and fall
+        # back to their defaults when the blob is validated again.
+        result_json = orjson.dumps(
+            result.model_dump(mode="json", exclude_none=True, by_alias=True)
+        )
+        blob_client = self._container_client.get_blob_client(filename)
+
+        await blob_client.upload_blob(
+            result_json,
+            length=len(result_json),
+            overwrite=True,
+            max_concurrency=_UPLOAD_MAX_CONCURRENCY,
+            content_settings=_JSON_CONTENT_SETTINGS,
+        )
+
+        return filename, str(blob_client.url), len(result_json)
@@ -1,65 +1,149 @@
+import logging
 import re
-from re import Pattern
+from functools import lru_cache
 from urllib.parse import parse_qs, urlparse
 
+import structlog
+
 from src.core.interfaces import LinkClassifier
 from src.core.models import ExtractedLink, LinkType
 
+logger = structlog.get_logger(__name__)
+
+# Distinct (url, text) pairs remembered per classifier; crawls keep seeing
+# the same nav, footer and social links on every page
+_CLASSIFY_CACHE_SIZE = 100_000
+
+# A download size in link text, e.g. the "3 MB" of "Syllabus (3 MB pdf)".
+# One digit is enough to find it; "\d+" only adds backtracking.
+_MB_SIZE_RE = re.compile(r"\d\s*MB", re.I)
+_PDF_TEXT_RE = re.compile(r"pdf", re.I)
+
+# Host fragment of iframe.ly proxies that may wrap a YouTube URL
+_IFRAMELY_MARKER = "iframe.ly"
+
+# Lowercase literal that every YouTube URL literal contains. A substring
+# check rules most links out before the literal loop runs; keep it in sync
+# with the list below.
+_YOUTUBE_MARKER = "youtu"
+
+# YouTube URL patterns. All are literals, so they are matched as substrings
+# of the lowercased URL rather than through the regex engine.
+_YOUTUBE_URL_LITERALS = (
+    "youtube.com/watch",
+    "youtu.be/",
+    # NEW: Add embed patterns
+    "youtube.com/embed/",
+    "youtube-nocookie.com",
+    "cdn.iframe.ly/",  # Broader pattern for iframe.ly YouTube embeds
+)
+
+
+def _is_pdf_url(lowered_url: str) -> bool:
+    """
+    Check a lowercased URL for ".pdf" at its end or before a query or
+    fragment, or for "pdf" followed anywhere later by "download".
+
+    Plain string scans keep this linear in the URL length; a "pdf.*download"
+    regex backtracked from every "pdf" occurrence.
+    """
+    # The common "\.pdf$" and "\.pdf[?#]" cases
+    if lowered_url.endswith(".pdf") or ".pdf?" in lowered_url or ".pdf#" in lowered_url:
+        return True
+    # "download" after any "pdf" is "download" after the first one
+    first = lowered_url.find("pdf")
+    return first >= 0 and lowered_url.find("download", first + 3) >= 0
+
+
+def _has_size_pdf_hint(text: str) -> bool:
+    """Check link text for a size in MB followed by "pdf" on the same line."""
+    pos = 0
+    searched_to = -1
+    while (size := _MB_SIZE_RE.search(text, pos)) is not None:
+        end = size.end()
+        # Sizes end in order, so only the first one on a line needs its
+        # rest of the line searched; later ones would search less of it.
+        # This keeps the scan linear where "MB.*pdf" was quadratic.
+        if end > searched_to:
+            line_end = text.find("\n", end)
+            if line_end < 0:
+                line_end = len(text)
+            if _PDF_TEXT_RE.search(text, end, line_end):
+                return True
+            searched_to = line_end
+        pos = size.start() + 1
+    return False
+
+
+def _is_youtube_url(lowered_url: str) -> bool:
+    """Check a lowercased URL against the YouTube URL literals."""
+    # A plain loop; any() over a generator costs more than the regex it replaces
+    for literal in _YOUTUBE_URL_LITERALS:
+        if literal in lowered_url:
+            return True
+    return False
+
 
 class ContextAwareClassifier(LinkClassifier):
     """Enhanced classifier using content context"""
 
     def __init__(self) -> None:
-        self._pdf_patterns: list[Pattern[str]] = [
-            re.compile(r"\.pdf$", re.I),
-            re.compile(r"\.pdf[?#]", re.I),  # PDFs with query params
-            re.compile(r"pdf.*download", re.I),  # Download contexts
-        ]
-
-        self._youtube_patterns: list[Pattern[str]] = [
-            re.compile(r"youtube\.com/watch", re.I),
-            re.compile(r"youtu\.be/", re.I),
-            # NEW: Add embed patterns
-            re.compile(r"youtube\.com/embed/", re.I),
-            re.compile(r"youtube-nocookie\.com", re.I),
-            re.compile(
-                r"cdn\.iframe\.ly/.*", re.I
-            ),  # Broader pattern for iframe.ly YouTube embeds
-        ]
+        # Classification is pure, so memoise it per instance
+        self._classify_cached = lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)(
+            self._classify_with_context
+        )
 
     def classify_links(self, links: list[tuple[str, str]]) -> list[ExtractedLink]:
         classified_links = []
+        classify = self._classify_cached
+        # Links already built in this call; nav and footer links repeat on a
+        # page, and copying a validated link is cheaper than validating again
+        built: dict[tuple[str, str], ExtractedLink] = {}
 
-        for url, text in links:
+        for pair in links:
+            link = built.get(pair)
+            if link is not None:
+                classified_links.append(link.model_copy())
+                continue
+
+            url, text = pair
             # Use MULTIPLE detection methods
-            link_type = self._classify_with_context(url, text)
-            classified_links.append(
-                ExtractedLink(url=url, link_text=text, link_type=link_type)
-            )
+            link_type = classify(url, text)
+            link = ExtractedLink(url=url, link_text=text, link_type=link_type)
+            built[pair] = link
+            classified_links.append(link)
 
+        # Skip gathering cache statistics nobody will see; asks the same
+        # filtering bound logger that would drop the debug event
+        if logger.is_enabled_for(logging.DEBUG):
+            cache_info = classify.cache_info()
+            logger.debug(
+                "classification_cache",
+                hits=cache_info.hits,
+                misses=cache_info.misses,
+                size=cache_info.currsize,
+            )
         return classified_links
 
     def _classify_with_context(self, url: str, text: str) -> LinkType:
         """Enhanced classification using URL + text context"""
+        lowered_url = url.lower()
+
         # 1) Try strict URL pattern matching first (covers cdn.iframe.ly etc.)
-        url_pattern_type = self._classify_by_url_patterns(url)
+        url_pattern_type = self._classify_by_url_patterns(lowered_url)
         if url_pattern_type != LinkType.OTHER:
             return url_pattern_type
 
         # 2) Detect file size hints such as "3MB pdf"
-        if re.search(r"\d+\s*MB.*pdf", text, re.I):
+        if _has_size_pdf_hint(text):
             return LinkType.PDF
 
-        lowered_url = url.lower()
-
         # 3) Special handling for iframe.ly proxies that wrap YouTube URLs
-        if "iframe.ly" in lowered_url:
+        if _IFRAMELY_MARKER in lowered_url:
             parsed = urlparse(url)
             qs = parse_qs(parsed.query)
             proxied_url: str | None = qs.get("url", [""])[0] or None
-            if proxied_url and any(
-                p.search(proxied_url) for p in self._youtube_patterns
-            ):
+            if proxied_url and _is_youtube_url(proxied_url.lower()):
                 return LinkType.YOUTUBE
 
         # 4) Heuristic YouTube detection from link text
@@ -68,9 +152,11 @@ class ContextAwareClassifier(LinkClassifier):
 
         return LinkType.OTHER
 
-    def _classify_by_url_patterns(self, url: str) -> LinkType:
-        if any(pattern.search(url) for pattern in self._pdf_patterns):
+    def _classify_by_url_patterns(self, lowered_url: str) -> LinkType:
+        if _is_pdf_url(lowered_url):
             return LinkType.PDF
-        if any(pattern.search(url) for pattern in self._youtube_patterns):
+        if (
+            _YOUTUBE_MARKER in lowered_url or _IFRAMELY_MARKER in lowered_url
+        ) and _is_youtube_url(lowered_url):
             return LinkType.YOUTUBE
         return LinkType.OTHER
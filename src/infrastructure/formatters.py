@@ -1,9 +1,12 @@
 """
 Formatters for extraction result output in different formats.
 """
+import csv
+import io
 from collections.abc import Callable
 from enum import Enum
 
+import orjson
 import structlog
 
 from src.core.exceptions import ResultFormattingError
@@ -72,80 +75,91 @@ class OutputFormatters(ResultFormatter):
 
     def _format_json(self, result: ExtractionResult) -> str:
         """Format result as JSON"""
-        return result.model_dump_json(indent=2)
+        # orjson pretty-prints faster than model_dump_json(indent=2), same output
+        return orjson.dumps(
+            result.model_dump(mode="json"), option=orjson.OPT_INDENT_2
+        ).decode()
 
     def _format_text(self, result: ExtractionResult) -> str:
         """Format result as plain text"""
-        lines = [
-            f"Extraction Results for: {result.source_url}",
-            f"Total Links Found: {result.total_links}",
-            "",
-            f"PDF Links ({len(result.pdf_links)}):",
-        ]
+        pdf_links = result.pdf_links
+        youtube_links = result.youtube_links
+        metadata = result.metadata
 
-        for link in result.pdf_links:
-            lines.append(f"- {link.link_text}: {link.url}")
+        # Write into one buffer instead of growing and joining a list of lines
+        buf = io.StringIO()
+        write = buf.write
 
-        lines.append("")
-        lines.append(f"YouTube Links ({len(result.youtube_links)}):")
-        for link in result.youtube_links:
-            lines.append(f"- {link.link_text}: {link.url}")
+        write(f"Extraction Results for: {result.source_url}\n")
+        write(f"Total Links Found: {result.total_links}\n\n")
+
+        write(f"PDF Links ({len(pdf_links)}):")
+        for link in pdf_links:
+            write(f"\n- {link.link_text}: {link.url}")
 
-        if result.metadata:
-            lines.append("")
-            lines.append("Extraction Information:")
-            lines.append(
-                f"- Processing Time: {result.metadata.processing_time.seconds:.2f} seconds"
+        write(f"\n\nYouTube Links ({len(youtube_links)}):")
+        for link in youtube_links:
+            write(f"\n- {link.link_text}: {link.url}")
+
+        if metadata:
+            write("\n\nExtraction Information:")
+            write(
+                f"\n- Processing Time: {metadata.processing_time.seconds:.2f} seconds"
             )
-            lines.append(f"- Extraction Date: {result.metadata.extraction_timestamp}")
+            write(f"\n- Extraction Date: {metadata.extraction_timestamp}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _format_markdown(self, result: ExtractionResult) -> str:
         """Format result as Markdown"""
-        lines = [
-            f"# Extraction Results for: {result.source_url}",
-            f"**Total Links Found:** {result.total_links}",
-            "",
-            f"## PDF Links ({len(result.pdf_links)})",
-        ]
+        pdf_links = result.pdf_links
+        youtube_links = result.youtube_links
+        other_links = result.other_links
+        metadata = result.metadata
 
-        for link in result.pdf_links:
-            lines.append(f"- [{link.link_text}]({link.url})")
+        buf = io.StringIO()
+        write = buf.write
 
-        lines.append("")
-        lines.append(f"## YouTube Links ({len(result.youtube_links)})")
-        for link in result.youtube_links:
-            lines.append(f"- [{link.link_text}]({link.url})")
+        write(f"# Extraction Results for: {result.source_url}\n")
+        write(f"**Total Links Found:** {result.total_links}\n\n")
 
-        lines.append("")
-        lines.append(f"## Other Links ({len(result.other_links)})")
-        for link in result.other_links:
-            lines.append(f"- [{link.link_text}]({link.url})")
+        write(f"## PDF Links ({len(pdf_links)})")
+        for link in pdf_links:
+            write(f"\n- [{link.link_text}]({link.url})")
 
-        if result.metadata:
-            lines.append("")
-            lines.append("## Extraction Information")
-            lines.append(
-                f"- **Processing Time:** {result.metadata.processing_time.seconds:.2f} seconds"
-            )
-            lines.append(
-                f"- **Extraction Date:** {result.metadata.extraction_timestamp}"
+        write(f"\n\n## YouTube Links ({len(youtube_links)})")
+        for link in youtube_links:
+            write(f"\n- [{link.link_text}]({link.url})")
+
+        write(f"\n\n## Other Links ({len(other_links)})")
+        for link in other_links:
+            write(f"\n- [{link.link_text}]({link.url})")
+
+        if metadata:
+            write("\n\n## Extraction Information")
+            write(
+                f"\n- **Processing Time:** {metadata.processing_time.seconds:.2f} seconds"
             )
+            write(f"\n- **Extraction Date:** {metadata.extraction_timestamp}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _format_csv(self, result: ExtractionResult) -> str:
         """Format result as CSV"""
-        lines = ["Type,Text,URL"]
+        # csv.writer quotes and escapes link text containing commas or quotes
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writerow = writer.writerow
+
+        writerow(("Type", "Text", "URL"))
 
         for link in result.pdf_links:
-            lines.append(f'PDF,"{link.link_text}",{link.url}')
+            writerow(("PDF", link.link_text, link.url))
 
         for link in result.youtube_links:
-            lines.append(f'YouTube,"{link.link_text}",{link.url}')
+            writerow(("YouTube", link.link_text, link.url))
 
         for link in result.other_links:
-            lines.append(f'Other,"{link.link_text}",{link.url}')
+            writerow(("Other", link.link_text, link.url))
 
-        return "\n".join(lines)
+        return buf.getvalue()
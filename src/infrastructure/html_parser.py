@@ -2,64 +2,84 @@
 HTML parser for extracting and processing links.
 """
 
-import re
+from collections.abc import Callable, Iterator
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
+from typing import cast
 
 import structlog
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 
 from src.core.exceptions import ExtractionContext, LinkParsingError
 from src.core.interfaces import LinkParser
 from src.core.value_objects import CorrelationId
+from src.settings import settings
 
+from .link_parsing import (
+    SKIP_PREFIXES,
+    CachingLinkParser,
+    clean_link_text,
+    resolve_url,
+)
 
-class SafeAttributeExtractor:
-    """Encapsulates type-safe HTML attribute extraction"""
+logger = structlog.get_logger(__name__)
 
-    @staticmethod
-    def get_string_attribute(element: Tag, attr: str, default: str = "") -> str:
-        """Type-safe string attribute extraction"""
-        value = element.get(attr)
-        if isinstance(value, str):
-            return value
-        return default
+# C-backed tree builder; far faster than the pure-Python "html.parser"
+_BS4_FEATURES = "lxml"
 
-    @staticmethod
-    def get_optional_string_attribute(element: Tag, attr: str) -> str | None:
-        """Type-safe optional string extraction"""
-        value = element.get(attr)
-        if isinstance(value, str):
-            return value
-        return None
+# With multi-valued attributes (class, rel, ...) disabled every attribute
+# value is a plain str, so elements can be read via attrs.get() directly
+_BS4_OPTIONS = {"multi_valued_attributes": None}
 
+# Elements that can carry an extractable link, matched in a single tree walk
+_LINK_TAGS = ["a", "iframe", "object", "embed"]
+
+# Only build tree nodes for link elements (and their contents); headings,
+# paragraphs, scripts etc. are never inspected
+_LINK_STRAINER = SoupStrainer(_LINK_TAGS)
+
+_ElementHandler = Callable[[Tag, str, str], tuple[str, str] | None]
 
-logger = structlog.get_logger(__name__)
 
+def _title_or(element: Tag, default: str) -> str:
+    """Return the element's title attribute, or ``default`` when absent."""
+    return cast("str | None", element.attrs.get("title")) or default
 
-class BeautifulSoupLinkParser(LinkParser):
+
+class BeautifulSoupLinkParser(CachingLinkParser[BeautifulSoup], LinkParser):
     """
     HTML link parser using BeautifulSoup.
 
     Implements the LinkParser protocol.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Tag name -> (attribute holding the target, handler building the link)
+        self._element_handlers: dict[str, tuple[str, _ElementHandler]] = {
+            "a": ("href", self._anchor_link),
+            "iframe": ("src", self._iframe_link),
+            "object": ("data", self._object_link),
+            "embed": ("src", self._embed_link),
+        }
+
+    def _build_tree(self, content: str) -> BeautifulSoup:
+        """Parse content into a soup of link elements only."""
+        return BeautifulSoup(
+            content, _BS4_FEATURES, parse_only=_LINK_STRAINER, **_BS4_OPTIONS
+        )
+
+    def _anchor_hrefs(self, tree: BeautifulSoup) -> Iterator[str | None]:
+        """Yield the href of every anchor in the soup."""
+        for anchor in tree.find_all("a", href=True):
+            yield cast("str | None", anchor.attrs.get("href"))
+
     def parse_links(self, content: str, base_url: str) -> list[tuple[str, str]]:
         """
         Parse links from HTML content with enhanced error context.
         """
         try:
-            soup = BeautifulSoup(content, "html.parser")
-            links = []
-
-            # Extract anchor links
-            links.extend(self._extract_anchor_links(soup, base_url))
-
-            # Extract iframe sources (YouTube embeds)
-            links.extend(self._extract_iframe_sources(soup, base_url))
-
-            # Extract object/embed sources (PDFs)
-            links.extend(self._extract_embedded_objects(soup, base_url))
+            soup = self._parse_document(content)
+            links = self._extract_all_links(soup, base_url)
 
             logger.debug("links_found", count=len(links), base_url=base_url)
             return links
@@ -75,139 +95,80 @@ class BeautifulSoupLinkParser(LinkParser):
                 f"Failed to parse links from {base_url}", context, e
             ) from e
 
-    def _extract_anchor_links(
+    def _extract_all_links(
         self, soup: BeautifulSoup, base_url: str
     ) -> list[tuple[str, str]]:
+        """Collect anchor, iframe, object and embed links in one tree walk."""
         extracted = []
-        for anchor in soup.find_all("a", href=True):
-            href = SafeAttributeExtractor.get_optional_string_attribute(anchor, "href")
-            if href and not href.startswith(("javascript:", "#", "mailto:", "tel:")):
-                full_url = urljoin(base_url, href)
-                # Use helper to obtain clean, de-duplicated text
-                text = self._get_link_text(anchor, full_url)
-                extracted.append((full_url, text))
+        handlers = self._element_handlers
+        for element in soup.find_all(_LINK_TAGS):
+            attr, handler = handlers[element.name]
+            target = cast("str | None", element.attrs.get(attr))
+            if target:
+                link = handler(element, target, base_url)
+                if link is not None:
+                    extracted.append(link)
         return extracted
 
-    def _extract_iframe_sources(
-        self, soup: BeautifulSoup, base_url: str
-    ) -> list[tuple[str, str]]:
-        extracted = []
-        for iframe in soup.find_all("iframe", src=True):
-            src = iframe.get("src")
-            if src:
-                full_url = urljoin(base_url, src)
-                text = iframe.get("title") or "Embedded Content"
-                extracted.append((full_url, text))
-        return extracted
-
-    def _extract_embedded_objects(
-        self, soup: BeautifulSoup, base_url: str
-    ) -> list[tuple[str, str]]:
-        extracted = []
-        # Object tags
-        for obj in soup.find_all("object", data=True):
-            data = obj.get("data")
-            if data:
-                full_url = urljoin(base_url, data)
-                text = obj.get("title") or "Embedded Object"
-                extracted.append((full_url, text))
-
-        # Embed tags
-        for embed in soup.find_all("embed", src=True):
-            src = embed.get("src")
-            if src:
-                full_url = urljoin(base_url, src)
-                text = embed.get("title") or "Embedded Content"
-                extracted.append((full_url, text))
-
-        return extracted
+    def _anchor_link(
+        self, anchor: Tag, href: str, base_url: str
+    ) -> tuple[str, str] | None:
+        if href.startswith(SKIP_PREFIXES):
+            return None
+        full_url = resolve_url(base_url, href)
+        # Use helper to obtain clean, de-duplicated text
+        return full_url, self._get_link_text(anchor, full_url)
+
+    def _iframe_link(
+        self, iframe: Tag, src: str, base_url: str
+    ) -> tuple[str, str] | None:
+        return resolve_url(base_url, src), _title_or(iframe, "Embedded Content")
+
+    def _object_link(
+        self, obj: Tag, data: str, base_url: str
+    ) -> tuple[str, str] | None:
+        return resolve_url(base_url, data), _title_or(obj, "Embedded Object")
+
+    def _embed_link(
+        self, embed: Tag, src: str, base_url: str
+    ) -> tuple[str, str] | None:
+        return resolve_url(base_url, src), _title_or(embed, "Embedded Content")
 
     def _get_link_text(self, element: Tag, url: str) -> str:
         """Get text for <a> tags, prioritizing download attribute if present."""
         # Candidate texts: download attr, inner text, href fallback
-        download_name = SafeAttributeExtractor.get_optional_string_attribute(
-            element, "download"
-        )
+        attrs = element.attrs
+        download_name = cast("str | None", attrs.get("download"))
 
         candidates: list[str | None] = [download_name]
 
-        element_text = element.get_text(strip=True)
+        # Most anchors hold a single text node; entities were already decoded
+        # by the parser, so stripping it gives get_text()'s result without
+        # walking descendants. Comments and CDATA are subclasses and excluded.
+        contents = element.contents
+        if len(contents) == 1 and type(contents[0]) is NavigableString:
+            element_text = contents[0].strip()
+        else:
+            element_text = element.get_text(strip=True)
         if element_text:
             candidates.append(element_text)
 
-        candidates.append(
-            SafeAttributeExtractor.get_string_attribute(element, "href", url)
-        )
+        candidates.append(cast(str, attrs.get("href", url)))
 
         # Pick first non-empty candidate
         raw_text: str = next((c for c in candidates if c), url)
 
-        # Post-process: collapse duplicate ".pdf" suffixes (e.g. "file.pdfpdf" → "file.pdf")
-        cleaned_text: str = re.sub(r"(\.pdf)+$", ".pdf", raw_text, flags=re.I)
-
-        return cleaned_text.strip()
-
-    def _get_iframe_text(self, element: Tag, url: str) -> str:
-        """Generate descriptive text for iframe content."""
-        # Check for YouTube indicators
-        if any(
-            indicator in url.lower()
-            for indicator in ["youtube", "youtu.be", "embed", "iframe.ly"]
-        ):
-            return "Embedded Video Content"
-
-        # Use title attribute if available
-        if title := SafeAttributeExtractor.get_optional_string_attribute(
-            element, "title"
-        ):
-            return title
-
-        # Fallback to URL
-        return f"Embedded Content: {url}"
-
-    def _get_embed_text(self, element: Tag, url: str) -> str:
-        """Generate descriptive text for <embed> content."""
-        # Use type attribute if available, otherwise fallback to URL
-        if embed_type := SafeAttributeExtractor.get_optional_string_attribute(
-            element, "type"
-        ):
-            return f"Embedded {embed_type.split('/')[-1].upper()} Content"
-        return f"Embedded Content: {url}"
-
-    def _is_valid_url(self, url: str) -> bool:
-        """
-        Check if URL is valid.
+        return clean_link_text(raw_text)
 
-        Args:
-            url: URL string to check
 
-        Returns:
-            True if URL is valid, False otherwise
-        """
+def create_link_parser() -> LinkParser:
+    """Build the link parser selected by ``settings.html_parser``."""
+    if settings.html_parser == "lexbor":
         try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:  # More specific exception handling
-            return False
-
-    def find_navigation_links(self, content: str, base_url: str) -> list[str]:
-        """Find sub-pages to crawl using existing parsing logic."""
-        soup = BeautifulSoup(content, "html.parser")
-        navigation_links: set[str] = set()
-
-        for anchor in soup.find_all("a", href=True):
-            href = SafeAttributeExtractor.get_optional_string_attribute(anchor, "href")
-            if href:
-                full_url = urljoin(base_url, href)
-                # Filter out external links, javascript, mailto, and fragment identifiers
-                if (
-                    self._is_valid_url(full_url)
-                    and urlparse(full_url).netloc == urlparse(base_url).netloc
-                    and not full_url.startswith(("javascript:", "mailto:", "#"))
-                    and not full_url.endswith(
-                        (".pdf", ".zip", ".tar.gz", ".docx", ".xlsx", ".pptx")
-                    )  # Exclude common file downloads
-                ):
-                    navigation_links.add(full_url)
-
-        return list(navigation_links)
+            from .lexbor_parser import LexborLinkParser
+        except ImportError:
+            # selectolax not installed
+            logger.warning("lexbor_parser_unavailable", fallback="beautifulsoup")
+        else:
+            return LexborLinkParser()
+    return BeautifulSoupLinkParser()
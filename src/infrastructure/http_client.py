@@ -2,7 +2,10 @@
 Async HTTP client for web content extraction.
 """
 import asyncio
+import random
+import weakref
 from datetime import datetime
+from typing import ClassVar
 
 import httpx
 import structlog
@@ -14,6 +17,29 @@ from src.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# Connection pool shared by every AsyncHttpClient on an event loop
+_POOL_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+# Bytes requested per read while streaming a response body
+_READ_CHUNK_SIZE = 65536
+
+# Upper bound in seconds on a single retry backoff
+_MAX_BACKOFF = 30.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter so retries to one host don't align."""
+    return min(_MAX_BACKOFF, 2.0**attempt) * random.uniform(0.5, 1.5)
+
+
+def _declared_too_large(content_length: str | None, max_bytes: int) -> bool:
+    """Check a Content-Length header value against the body size limit."""
+    return (
+        content_length is not None
+        and content_length.isdigit()
+        and int(content_length) > max_bytes
+    )
+
 
 class AsyncHttpClient(ContentExtractor):
     """
@@ -22,16 +48,26 @@ class AsyncHttpClient(ContentExtractor):
     Implements the ContentExtractor protocol.
     """
 
+    # One pooled httpx client per event loop and (timeout, retries), shared
+    # by all instances so TLS sessions and keep-alive connections are reused
+    _shared_clients: ClassVar[
+        weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[float, int], httpx.AsyncClient]
+        ]
+    ] = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         timeout: float | None = None,
         max_retries: int | None = None,
         user_agent: str | None = None,
         headers: dict[str, str] | None = None,
+        max_body_bytes: int | None = None,
     ):
         self.timeout = timeout or settings.http_timeout
         self.max_retries = max_retries or settings.max_retries
         self.user_agent = user_agent or settings.user_agent
+        self.max_body_bytes = max_body_bytes or settings.max_body_bytes
 
         self._headers = {
             "User-Agent": self.user_agent,
@@ -42,6 +78,62 @@ class AsyncHttpClient(ContentExtractor):
         if headers:
             self._headers.update(headers)
 
+        # Instances with equal settings share a pooled client
+        self._pool_key = (self.timeout, self.max_retries)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client for the running loop, creating it lazily."""
+        clients = self._shared_clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(self._pool_key)
+        if client is None or client.is_closed:
+            # Failed connection attempts (ConnectError, ConnectTimeout) are
+            # retried inside the transport; extract_content's loop only
+            # retries read, write and pool timeouts and 5xx responses
+            transport = httpx.AsyncHTTPTransport(
+                retries=self.max_retries, http2=True, limits=_POOL_LIMITS
+            )
+            client = httpx.AsyncClient(
+                transport=transport, timeout=self.timeout, follow_redirects=True
+            )
+            clients[self._pool_key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client for the running loop and its connections."""
+        clients = self._shared_clients.get(asyncio.get_running_loop(), {})
+        client = clients.pop(self._pool_key, None)
+        if client is not None:
+            await client.aclose()
+
+    async def _read_text(
+        self, response: httpx.Response, context: ExtractionContext
+    ) -> str:
+        """
+        Read and decode a streamed body, refusing ones over max_body_bytes.
+
+        Raises:
+            ContentExtractionError: If the body is larger than allowed
+        """
+        max_bytes = self.max_body_bytes
+        # Refuse before downloading anything when the size is declared
+        if _declared_too_large(response.headers.get("content-length"), max_bytes):
+            raise ContentExtractionError(
+                f"Response from {context.url} exceeds {max_bytes} bytes", context
+            )
+
+        body = bytearray()
+        extend = body.extend
+        async for chunk in response.aiter_bytes(_READ_CHUNK_SIZE):
+            extend(chunk)
+            # Chunked or compressed bodies can outgrow their declared size
+            if len(body) > max_bytes:
+                raise ContentExtractionError(
+                    f"Response from {context.url} exceeds {max_bytes} bytes", context
+                )
+
+        # Same charset resolution and error handling as response.text
+        return body.decode(response.encoding or "utf-8", errors="replace")
+
     async def extract_content(self, url: str) -> str:
         """
         Extract HTML content from a URL with retries, using enhanced error context.
@@ -55,74 +147,85 @@ class AsyncHttpClient(ContentExtractor):
             user_agent=self.user_agent,
         )
 
-        async with httpx.AsyncClient(
-            timeout=self.timeout, follow_redirects=True
-        ) as client:
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    response = await client.get(url, headers=self._headers)
+        client = self._get_client()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                async with client.stream("GET", url, headers=self._headers) as response:
                     response.raise_for_status()
+                    text = await self._read_text(response, context)
 
                     # Log successful extraction
-                    content_length = len(response.text)
                     logger.debug(
                         "content_extracted",
                         url=url,
-                        content_length=content_length,
+                        content_length=len(text),
                         status_code=response.status_code,
                         correlation_id=str(correlation_id),
                     )
 
-                    return str(response.text)
-
-                except httpx.TimeoutException as e:
-                    logger.warning(
-                        "request_timeout",
-                        url=url,
-                        attempt=attempt,
-                        max_retries=self.max_retries,
-                        correlation_id=str(correlation_id),
-                    )
-
-                    if attempt < self.max_retries:
-                        await asyncio.sleep(2**attempt)  # exponential backoff
-                    else:
-                        raise ContentExtractionError(
-                            f"Timeout extracting content from {url}", context, cause=e
-                        ) from e
-
-                except httpx.HTTPStatusError as e:
-                    logger.warning(
-                        "http_error",
-                        url=url,
-                        status_code=e.response.status_code,
-                        attempt=attempt,
-                        correlation_id=str(correlation_id),
-                    )
+                    return text
+
+            except httpx.TimeoutException as e:
+                logger.warning(
+                    "request_timeout",
+                    url=url,
+                    attempt=attempt,
+                    max_retries=self.max_retries,
+                    correlation_id=str(correlation_id),
+                )
+
+                # Connect timeouts were already retried by the transport
+                if attempt < self.max_retries and not isinstance(
+                    e, httpx.ConnectTimeout
+                ):
+                    await asyncio.sleep(_backoff_delay(attempt))
+                else:
+                    raise ContentExtractionError(
+                        f"Timeout extracting content from {url}", context, cause=e
+                    ) from e
 
-                    if (
-                        500 <= e.response.status_code < 600
-                        and attempt < self.max_retries
-                    ):
-                        await asyncio.sleep(2**attempt)
-                    else:
-                        raise ContentExtractionError(
-                            f"HTTP error {e.response.status_code} extracting content from {url}",
-                            context,
-                            cause=e,
-                        ) from e
-
-                except httpx.HTTPError as e:
-                    logger.error(
-                        "http_exception",
-                        url=url,
-                        error=str(e),
-                        attempt=attempt,
-                        correlation_id=str(correlation_id),
-                    )
+            except httpx.HTTPStatusError as e:
+                logger.warning(
+                    "http_error",
+                    url=url,
+                    status_code=e.response.status_code,
+                    attempt=attempt,
+                    correlation_id=str(correlation_id),
+                )
+
+                if 500 <= e.response.status_code < 600 and attempt < self.max_retries:
+                    await asyncio.sleep(_backoff_delay(attempt))
+                else:
                     raise ContentExtractionError(
-                        f"HTTP error extracting content from {url}", context, cause=e
+                        f"HTTP error {e.response.status_code} extracting content from {url}",
+                        context,
+                        cause=e,
                     ) from e
 
+            except httpx.HTTPError as e:
+                logger.error(
+                    "http_exception",
+                    url=url,
+                    error=str(e),
+                    attempt=attempt,
+                    correlation_id=str(correlation_id),
+                )
+                raise ContentExtractionError(
+                    f"HTTP error extracting content from {url}", context, cause=e
+                ) from e
+
         # This should not be reached due to exceptions above
         raise ContentExtractionError(f"Failed to extract content from {url}", context)
+
+
+def create_content_extractor() -> ContentExtractor:
+    """Build the HTTP client selected by ``settings.http_client``."""
+    if settings.http_client == "aiohttp":
+        try:
+            from .aiohttp_client import AiohttpHttpClient
+        except ImportError:
+            # aiohttp not installed
+            logger.warning("aiohttp_client_unavailable", fallback="httpx")
+        else:
+            return AiohttpHttpClient()
+    return AsyncHttpClient()
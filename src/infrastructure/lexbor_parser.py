@@ -0,0 +1,107 @@
+"""
+HTML link parser backed by selectolax's Lexbor engine.
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+
+import structlog
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from src.core.exceptions import ExtractionContext, LinkParsingError
+from src.core.interfaces import LinkParser
+from src.core.value_objects import CorrelationId
+
+from .link_parsing import (
+    SKIP_PREFIXES,
+    CachingLinkParser,
+    clean_link_text,
+    resolve_url,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Elements carrying an extractable link, selected in document order
+_LINK_SELECTOR = "a[href], iframe[src], object[data], embed[src]"
+
+# Tag name -> (attribute holding the target, default text for embedded content)
+_EMBED_TARGETS = {
+    "iframe": ("src", "Embedded Content"),
+    "object": ("data", "Embedded Object"),
+    "embed": ("src", "Embedded Content"),
+}
+
+
+class LexborLinkParser(CachingLinkParser[LexborHTMLParser], LinkParser):
+    """
+    HTML link parser using selectolax's C Lexbor parser.
+
+    Produces the same links as BeautifulSoupLinkParser without building a
+    Python object for every tag. Implements the LinkParser protocol.
+    """
+
+    def _build_tree(self, content: str) -> LexborHTMLParser:
+        """Parse content into a Lexbor document."""
+        return LexborHTMLParser(content)
+
+    def _anchor_hrefs(self, tree: LexborHTMLParser) -> Iterator[str | None]:
+        """Yield the href of every anchor in the document."""
+        for node in tree.css("a[href]"):
+            yield node.attributes.get("href")
+
+    def parse_links(self, content: str, base_url: str) -> list[tuple[str, str]]:
+        """
+        Parse links from HTML content with enhanced error context.
+        """
+        try:
+            tree = self._parse_document(content)
+            links = self._extract_all_links(tree, base_url)
+
+            logger.debug("links_found", count=len(links), base_url=base_url)
+            return links
+
+        except Exception as e:
+            logger.error("parsing_failed", error=str(e), base_url=base_url)
+            context = ExtractionContext(
+                url=base_url,
+                correlation_id=CorrelationId.generate(),
+                start_time=datetime.now(),
+            )
+            raise LinkParsingError(
+                f"Failed to parse links from {base_url}", context, e
+            ) from e
+
+    def _extract_all_links(
+        self, tree: LexborHTMLParser, base_url: str
+    ) -> list[tuple[str, str]]:
+        """Collect anchor, iframe, object and embed links in one selection."""
+        extracted: list[tuple[str, str]] = []
+        append = extracted.append
+        resolve = resolve_url
+        skip_prefixes = SKIP_PREFIXES
+        get_link_text = self._get_link_text
+
+        for node in tree.css(_LINK_SELECTOR):
+            attrs = node.attributes
+            tag = node.tag or ""
+            if tag == "a":
+                href = attrs.get("href")
+                if not href or href.startswith(skip_prefixes):
+                    continue
+                append((resolve(base_url, href), get_link_text(node, href)))
+            else:
+                attr, default_text = _EMBED_TARGETS[tag]
+                target = attrs.get(attr)
+                if target:
+                    text = attrs.get("title") or default_text
+                    append((resolve(base_url, target), text))
+        return extracted
+
+    def _get_link_text(self, node: LexborNode, href: str) -> str:
+        """Get text for <a> tags, prioritizing download attribute if present."""
+        raw_text = (
+            node.attributes.get("download")
+            or node.text(deep=True, separator="", strip=True)
+            or href
+        )
+        return clean_link_text(raw_text)
@@ -2,71 +2,131 @@
 Link classifier implementation.
 """
 
-import re
-from re import Pattern
+from functools import lru_cache
 
 import structlog
 
-from src.core.models import ExtractedLink
+from src.core.models import ExtractedLink, LinkType
 
 logger = structlog.get_logger(__name__)
 
+# Distinct (url, text) pairs remembered across classifiers; crawls keep
+# seeing the same nav, footer and social links on every page
+_CLASSIFY_CACHE_SIZE = 8192
 
-class RegexLinkClassifier:
-    def __init__(self) -> None:
-        # Enhanced PDF patterns
-        self._pdf_patterns: list[Pattern[str]] = [
-            re.compile(r"\.pdf$", re.I),
-            re.compile(r"\.pdf[?#]", re.I),
-            re.compile(r"\.pdf.*download", re.I),
-            re.compile(r"[^/]*\.pdf[^/]*$", re.I),  # Better PDF detection
-        ]
-
-        # Enhanced YouTube patterns
-        self._youtube_patterns: list[Pattern[str]] = [
-            re.compile(r"youtube\.com/watch", re.I),
-            re.compile(r"youtu\.be/", re.I),
-            re.compile(r"youtube\.com/embed/", re.I),
-            re.compile(r"youtube-nocookie\.com", re.I),
-        ]
+# Link text hints, looked for in the lowercased text; "pdf" anywhere also
+# covers a ".pdf" file name. Plain substring tests, since re.I searches walk
+# Unicode case folding for every character.
+_PDF_TEXT_HINT = "pdf"
+_YOUTUBE_TEXT_HINT = "youtube"
+_WATCH_TEXT_HINT = "watch"
+
+# Enhanced YouTube URL patterns. All are literals, so they are matched as
+# substrings of the lowercased URL rather than through the regex engine.
+_YOUTUBE_URL_LITERALS = (
+    "youtube.com/watch",
+    "youtu.be/",
+    "youtube.com/embed/",
+    "youtube-nocookie.com",
+)
+
+# Lowercase literal that every YouTube URL literal contains. A substring
+# check rules most links out before the literal loop runs; keep it in sync
+# with the list above.
+_YOUTUBE_MARKER = "youtu"
+
+
+def _is_pdf_url(lowered_url: str) -> bool:
+    """
+    Check a lowercased URL for ".pdf" at its end, before a query or fragment,
+    in the last path segment, or followed anywhere later by "download".
+
+    Plain string scans keep this linear in the URL length; the equivalent
+    ".*" and "[^/]*" regexes backtracked from every ".pdf" occurrence,
+    which is quadratic on URLs that repeat it.
+    """
+    # The common "\.pdf$" and "\.pdf[?#]" cases
+    if lowered_url.endswith(".pdf") or ".pdf?" in lowered_url or ".pdf#" in lowered_url:
+        return True
+    first = lowered_url.find(".pdf")
+    if first < 0:
+        return False
+    # "download" after any ".pdf" is "download" after the first one, and
+    # ".pdf" in the last path segment is the last ".pdf" after the last "/"
+    return lowered_url.find("download", first + 4) >= 0 or lowered_url.rfind(
+        ".pdf"
+    ) > lowered_url.rfind("/")
+
+
+def _is_youtube_url(lowered_url: str) -> bool:
+    """Check a lowercased URL against the YouTube URL literals."""
+    # A plain loop; any() over a generator costs more than the regex it replaces
+    for literal in _YOUTUBE_URL_LITERALS:
+        if literal in lowered_url:
+            return True
+    return False
+
+
+# Link type -> ExtractedLink factory
+_LINK_FACTORIES = {
+    LinkType.PDF: ExtractedLink.create_pdf_link,
+    LinkType.YOUTUBE: ExtractedLink.create_youtube_link,
+    LinkType.OTHER: ExtractedLink.create_other_link,
+}
+
+
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
+def _classify_link(url: str, text: str) -> LinkType:
+    """Classify one link: PDF first, then YouTube, otherwise other."""
+    lowered_url = url.lower()
+    lowered_text = text.lower()
+    if _is_pdf_link(lowered_url, lowered_text):
+        return LinkType.PDF
+    if _is_youtube_link(lowered_url, lowered_text):
+        return LinkType.YOUTUBE
+    return LinkType.OTHER
+
+
+def _is_pdf_link(lowered_url: str, lowered_text: str) -> bool:
+    # Check URL patterns, then text content
+    return _is_pdf_url(lowered_url) or _PDF_TEXT_HINT in lowered_text
 
+
+def _is_youtube_link(lowered_url: str, lowered_text: str) -> bool:
+    # Check URL patterns (only if the marker is present), then text content
+    if _YOUTUBE_MARKER in lowered_url and _is_youtube_url(lowered_url):
+        return True
+    return _YOUTUBE_TEXT_HINT in lowered_text or _WATCH_TEXT_HINT in lowered_text
+
+
+class RegexLinkClassifier:
     def classify_links(self, links: list[tuple[str, str]]) -> list[ExtractedLink]:
-        classified_links = []
+        classified_links: list[ExtractedLink] = []
+        append = classified_links.append
+        classify = _classify_link
+        factories = _LINK_FACTORIES
+        # Links already built in this call; nav and footer links repeat on a
+        # page, and copying a validated link is cheaper than validating again
+        built: dict[tuple[str, str], ExtractedLink] = {}
 
-        for url, text in links:
-            # Debug logging
-            logger.debug("classifying_link", url=url[:100], text=text[:50])
+        for pair in links:
+            link = built.get(pair)
+            if link is not None:
+                append(link.model_copy())
+                continue
 
+            url, text = pair
             try:
-                if self._is_pdf_link(url, text):
-                    link = ExtractedLink.create_pdf_link(url, text)
-                elif self._is_youtube_link(url, text):
-                    link = ExtractedLink.create_youtube_link(url, text)
-                else:
-                    link = ExtractedLink.create_other_link(url, text)
-
-                classified_links.append(link)
+                link = factories[classify(url, text)](url, text)
 
             except ValueError as e:
                 logger.warning("invalid_link_skipped", url=url, error=str(e))
                 continue
 
-        return classified_links
+            built[pair] = link
+            append(link)
 
-    def _is_pdf_link(self, url: str, text: str) -> bool:
-        # Check URL patterns
-        if any(pattern.search(url) for pattern in self._pdf_patterns):
-            return True
-        # Check text content
-        if re.search(r"\.pdf\b", text, re.I) or "PDF" in text.upper():
-            return True
-        return False
-
-    def _is_youtube_link(self, url: str, text: str) -> bool:
-        # Check URL patterns
-        if any(pattern.search(url) for pattern in self._youtube_patterns):
-            return True
-        # Check text content
-        if "youtube" in text.lower() or "watch" in text.lower():
-            return True
-        return False
+        logger.debug(
+            "links_classified", input_count=len(links), count=len(classified_links)
+        )
+        return classified_links
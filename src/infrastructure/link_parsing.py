@@ -0,0 +1,129 @@
+"""
+Helpers shared by the HTML link parser backends.
+"""
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Generic, TypeVar
+from urllib.parse import urljoin, urlsplit
+
+# Anchor targets that never point at a fetchable resource
+SKIP_PREFIXES = ("javascript:", "#", "mailto:", "tel:")
+
+# Downloads that are never worth crawling as navigation pages
+_SKIP_SUFFIXES = (".pdf", ".zip", ".tar.gz", ".docx", ".xlsx", ".pptx")
+
+# One or more ".pdf" suffixes, as in "file.pdf.pdf"
+_PDF_SUFFIX_RE = re.compile(r"(\.pdf)+$", re.I)
+
+# Schemes of hrefs that are already absolute and need no joining
+_ABSOLUTE_PREFIXES = ("http://", "https://")
+
+# (base_url, href) pairs remembered by resolve_url; nav and footer links
+# repeat on every page of a site
+_RESOLVE_CACHE_SIZE = 8192
+
+_TreeT = TypeVar("_TreeT")
+
+
+@lru_cache(maxsize=_RESOLVE_CACHE_SIZE)
+def resolve_url(base_url: str, href: str) -> str:
+    """Join ``href`` onto ``base_url``, skipping urljoin for absolute URLs."""
+    # urljoin returns absolute hrefs unchanged apart from dropping an empty
+    # trailing query or fragment and stripping tabs and newlines, so only
+    # those need the slow path
+    if (
+        href.startswith(_ABSOLUTE_PREFIXES)
+        and not href.endswith(("?", "#"))
+        and "\n" not in href
+        and "\t" not in href
+        and "\r" not in href
+    ):
+        return href
+    return urljoin(base_url, href)
+
+
+def clean_link_text(raw_text: str) -> str:
+    """Strip link text and collapse duplicate ".pdf" suffixes."""
+    # Most link text has no ".pdf" suffix, so skip the case-insensitive
+    # regex unless it can match; its "$" also matches before a final "\n"
+    tail = raw_text[-5:].lower()
+    if tail.endswith(".pdf") or tail == ".pdf\n":
+        # e.g. "file.pdf.pdf" → "file.pdf"
+        return _PDF_SUFFIX_RE.sub(".pdf", raw_text).strip()
+    return raw_text.strip()
+
+
+def filter_navigation_hrefs(hrefs: Iterable[str | None], base_url: str) -> list[str]:
+    """Resolve anchor hrefs and keep the same-site pages worth crawling."""
+    navigation_links: set[str] = set()
+    base_netloc = urlsplit(base_url).netloc
+
+    # Local bindings keep the per-anchor lookups on the fast path
+    resolve = resolve_url
+    skip_prefixes = SKIP_PREFIXES
+    skip_suffixes = _SKIP_SUFFIXES
+    split = urlsplit
+    add = navigation_links.add
+
+    for href in hrefs:
+        # Filter out javascript, mailto and fragment identifiers before joining
+        if not href or href.startswith(skip_prefixes):
+            continue
+        try:
+            full_url = resolve(base_url, href)
+            # Exclude common file downloads before paying for a URL split
+            if full_url.endswith(skip_suffixes):
+                continue
+            parsed = split(full_url)
+        except ValueError:
+            # Malformed href, e.g. an unterminated IPv6 host
+            continue
+        # Keep valid same-site pages
+        if parsed.scheme and parsed.netloc and parsed.netloc == base_netloc:
+            add(full_url)
+
+    return list(navigation_links)
+
+
+class CachingLinkParser(Generic[_TreeT]):
+    """
+    Parse-tree cache and navigation link lookup shared by parser backends.
+
+    Subclasses build the tree and list its anchor hrefs.
+    """
+
+    def __init__(self) -> None:
+        # Most recent (content, tree); the crawler hands the same content
+        # string to parse_links and then find_navigation_links
+        self._last_parse: tuple[str, _TreeT] | None = None
+
+    def _build_tree(self, content: str) -> _TreeT:
+        """Parse content into the backend's tree."""
+        raise NotImplementedError
+
+    def _anchor_hrefs(self, tree: _TreeT) -> Iterable[str | None]:
+        """Yield the href of every anchor in the tree."""
+        raise NotImplementedError
+
+    def _parse_document(self, content: str) -> _TreeT:
+        """Parse content, reusing the previous tree for the same string object."""
+        last_parse = self._last_parse
+        if last_parse is not None and last_parse[0] is content:
+            return last_parse[1]
+        tree = self._build_tree(content)
+        self._last_parse = (content, tree)
+        return tree
+
+    def clear_parse_cache(self) -> None:
+        """Drop the cached tree so the last page's content can be freed."""
+        self._last_parse = None
+
+    def find_navigation_links(self, content: str, base_url: str) -> list[str]:
+        """Find sub-pages to crawl using existing parsing logic."""
+        tree = self._parse_document(content)
+        navigation_links = filter_navigation_hrefs(self._anchor_hrefs(tree), base_url)
+        # Navigation links are the last use of a page's tree
+        self._last_parse = None
+        return navigation_links
@@ -1,10 +1,14 @@
 """
 Local file storage implementation.
 """
+import itertools
 import os
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
+from typing import ClassVar
 
+import orjson
 import structlog
 
 from src.core.exceptions import ResultStorageError
@@ -15,6 +19,39 @@ from src.settings import settings
 logger = structlog.get_logger(__name__)
 
 
+# Process-wide sequence number; with the nanosecond clock it makes generated
+# names unique without formatting a datetime or retrying on collisions
+_save_counter = itertools.count()
+
+
+def _unique_suffix() -> str:
+    """Return a filename suffix unique within this process."""
+    return f"{time.time_ns()}_{next(_save_counter)}"
+
+
+def _write_atomically(file_path: Path, data: bytes) -> None:
+    """
+    Write data to a temporary sibling file, then rename it over file_path.
+
+    Readers never see a partially written result.
+    """
+    # The pid keeps temporary names distinct across worker processes
+    tmp_path = file_path.with_name(
+        f"{file_path.name}.{os.getpid()}_{_unique_suffix()}.tmp"
+    )
+    try:
+        # "x" (O_EXCL) so a temporary file is never shared or clobbered
+        with open(tmp_path, "xb") as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except FileExistsError:
+        # Not ours; leave it alone
+        raise
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class LocalFileStorage(ResultStorage):
     """
     Local file storage implementation.
@@ -22,23 +59,35 @@ class LocalFileStorage(ResultStorage):
     Implements the ResultStorage protocol.
     """
 
+    # Directories already created in this process, shared by all instances
+    _ensured_dirs: ClassVar[set[Path]] = set()
+    _ensured_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, output_dir: Path | None = None):
         self.output_dir = output_dir or settings.output_directory
         self._ensure_directory_exists()
 
-    def _ensure_directory_exists(self) -> None:
+    def _ensure_directory_exists(self, recreate: bool = False) -> None:
         """
-        Ensure output directory exists
+        Ensure output directory exists, touching the filesystem only once
+        per directory for the lifetime of the process.
+
+        With ``recreate`` the directory is created again even if it was
+        ensured before, e.g. after being removed at runtime.
         """
-        try:
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            logger.error(
-                "directory_creation_failed", path=str(self.output_dir), error=str(e)
-            )
-            raise ResultStorageError(
-                f"Failed to create directory {self.output_dir}: {e}"
-            ) from e
+        with self._ensured_lock:
+            if not recreate and self.output_dir in self._ensured_dirs:
+                return
+            try:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                logger.error(
+                    "directory_creation_failed", path=str(self.output_dir), error=str(e)
+                )
+                raise ResultStorageError(
+                    f"Failed to create directory {self.output_dir}: {e}"
+                ) from e
+            self._ensured_dirs.add(self.output_dir)
 
     async def save_result(
         self, result: ExtractionResult, filename: str | None = None
@@ -56,61 +105,35 @@ class LocalFileStorage(ResultStorage):
         Raises:
             ResultStorageError: If saving fails
         """
-        max_retries = 1  # The test expects one retry (2 calls to open)
-        retries = 0
+        if filename is None:
+            domain = (
+                result.source_url.value.host.replace("www.", "")
+                if result.source_url.value.host
+                else "unknown_domain"
+            )
+            filename = f"extraction_{domain}_{_unique_suffix()}.json"
+        elif not filename.endswith(".json"):
+            filename += ".json"
+
+        file_path = self.output_dir / filename
+
+        try:
+            # orjson emits the UTF-8 bytes directly, so the document is
+            # never held as a str and then encoded again while writing
+            result_json = orjson.dumps(
+                result.model_dump(mode="json"), option=orjson.OPT_INDENT_2
+            )
 
-        while retries <= max_retries:
             try:
-                effective_filename = filename
-                if effective_filename is None or retries > 0:
-                    # Generate a unique filename for retries or if not provided
-                    domain = (
-                        result.source_url.value.host.replace("www.", "")
-                        if result.source_url.value.host
-                        else "unknown_domain"
-                    )
-                    timestamp = datetime.now().strftime(
-                        "%Y%m%d_%H%M%S_%f"
-                    )  # Add microseconds for higher uniqueness
-
-                    if filename is None:  # If no initial filename provided
-                        effective_filename = f"extraction_{domain}_{timestamp}.json"
-                    else:  # If initial filename provided, append timestamp for retry
-                        base, ext = os.path.splitext(filename)
-                        effective_filename = f"{base}_{timestamp}{ext}"
-
-                if not effective_filename.endswith(".json"):
-                    effective_filename += ".json"
-
-                file_path = self.output_dir / effective_filename
-
-                result_json = result.model_dump_json(indent=2)
-
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(result_json)
-
-                logger.info("result_saved", path=str(file_path), size=len(result_json))
-                return str(file_path)
-
-            except FileExistsError as e:
-                # This block will be hit by the mock's side_effect
-                logger.warning(
-                    "file_exists_on_save",
-                    path=str(file_path),
-                    error=str(e),
-                    retry_attempt=retries + 1,
-                )
-                retries += 1
-                if retries > max_retries:  # If all retries exhausted
-                    logger.error(
-                        "max_retries_reached_on_save", path=str(file_path), error=str(e)
-                    )
-                    raise ResultStorageError(
-                        f"Failed to save result after {max_retries} attempts due to existing file: {e}"
-                    ) from e
-            except Exception as e:
-                logger.error("save_failed", error=str(e))
-                raise ResultStorageError(f"Failed to save result: {e}") from e
+                _write_atomically(file_path, result_json)
+            except FileNotFoundError:
+                # The directory was removed after it was first ensured
+                self._ensure_directory_exists(recreate=True)
+                _write_atomically(file_path, result_json)
+
+        except Exception as e:
+            logger.error("save_failed", path=str(file_path), error=str(e))
+            raise ResultStorageError(f"Failed to save result: {e}") from e
 
-        # This line should logically be unreachable given the loop condition and raise in except block
-        raise ResultStorageError("Unexpected error during file save retry logic.")
+        logger.info("result_saved", path=str(file_path), size=len(result_json))
+        return str(file_path)
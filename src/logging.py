@@ -9,7 +9,7 @@ from typing import Any
 
 import structlog
 from structlog.processors import CallsiteParameter
-from structlog.stdlib import BoundLogger
+from structlog.typing import FilteringBoundLogger
 
 
 def setup_logging(
@@ -24,10 +24,10 @@ def setup_logging(
         service_name: Service identifier for log correlation
     """
 
+    log_level = getattr(logging, level.upper())
+
     # Configure stdlib logging
-    logging.basicConfig(
-        format="%(message)s", stream=sys.stdout, level=getattr(logging, level.upper())
-    )
+    logging.basicConfig(format="%(message)s", stream=sys.stdout, level=log_level)
 
     # Configure structlog processors
     processors: list[Callable[..., Any]] = [
@@ -57,7 +57,9 @@ def setup_logging(
     # Configure structlog
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the level return immediately, before any context is
+        # merged or processor (including the callsite frame walk) runs
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
@@ -67,6 +69,6 @@ def setup_logging(
     structlog.contextvars.bind_contextvars(service=service_name)
 
 
-def get_logger(name: str | None = None) -> BoundLogger:
+def get_logger(name: str | None = None) -> FilteringBoundLogger:
     """Get a logger instance with service context"""
     return structlog.get_logger(name)
@@ -27,11 +27,28 @@ class Settings(BaseSettings):
         default=3, description="Maximum number of HTTP retry attempts", ge=0, le=10
     )
 
+    max_body_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        description="Largest response body accepted, in bytes",
+        gt=0,
+    )
+
+    http_client: Literal["httpx", "aiohttp"] = Field(
+        default="httpx",
+        description="HTTP client backend (aiohttp requires the aiohttp group)",
+    )
+
     user_agent: str = Field(
         default="WebExtractor/1.0 (+https://github.com/company/web-extractor)",
         description="HTTP User-Agent header",
     )
 
+    # Parsing Settings
+    html_parser: Literal["beautifulsoup", "lexbor"] = Field(
+        default="beautifulsoup",
+        description="HTML parser backend (lexbor requires selectolax)",
+    )
+
     # Application Settings
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
         default="INFO", description="Logging level"
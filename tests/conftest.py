@@ -29,7 +29,7 @@ def temp_output_dir() -> Generator[Path, Any, None]:
         yield Path(temp_dir)
 
 
-@pytest.fixture  # type: ignore[misc]
+@pytest.fixture(scope="session")  # type: ignore[misc]
 def sample_html_content() -> str:
     """Sample HTML content for testing."""
     return """
@@ -80,13 +80,13 @@ def sample_urls() -> list[str]:
     ]
 
 
-@pytest.fixture  # type: ignore[misc]
+@pytest.fixture(scope="session")  # type: ignore[misc]
 def sample_correlation_id() -> CorrelationId:
     """Sample correlation ID for testing."""
     return CorrelationId.generate()
 
 
-@pytest.fixture  # type: ignore[misc]
+@pytest.fixture(scope="session")  # type: ignore[misc]
 def sample_source_url() -> SourceUrl:
     """Sample source URL for testing."""
     return SourceUrl.from_string("https://example.com")
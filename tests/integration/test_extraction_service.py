@@ -1,10 +1,12 @@
 """
 Integration tests for the extraction service.
 """
+from collections.abc import AsyncIterator
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from httpx import AsyncClient, Response
 
 from src.core import ExtractionService
 from src.core.exceptions import ContentExtractionError, ExtractionContext
@@ -17,6 +19,49 @@ from src.infrastructure import (
     LocalFileStorage,
 )
 
+# Mocked page bodies, shared by the tests below
+_MOCK_HTML_WITH_LINKS = """
+<html>
+    <head><title>Test Page</title></head>
+    <body>
+        <a href="https://example.com/document.pdf">Download PDF</a>
+        <a href="https://youtube.com/watch?v=abc123">Watch Video</a>
+        <a href="https://example.com">Home Page</a>
+    </body>
+</html>
+"""
+_MOCK_HTML_PDF_ONLY = '<a href="https://example.com/doc.pdf">PDF</a>'
+_MOCK_HTML_EMPTY = "<html><body><p>No links here</p></body></html>"
+# Relative, nested-markup, embedded and skipped links for parser comparisons
+_MOCK_HTML_MIXED = """
+<html>
+    <body>
+        <a href="/files/guide.pdf">Course Guide</a>
+        <a href="https://youtu.be/xyz789"> Quick <b>Demo</b> </a>
+        <iframe src="https://www.youtube.com/embed/abc"></iframe>
+        <a href="/about">About</a>
+        <a href="mailto:team@example.com">Email</a>
+    </body>
+</html>
+"""
+
+
+def _streaming_client(html: str) -> MagicMock:
+    """Build an httpx client mock whose stream() responds with ``html``."""
+    mock_response = MagicMock(spec=Response)
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.encoding = "utf-8"
+
+    async def aiter_bytes(chunk_size: int) -> AsyncIterator[bytes]:
+        yield html.encode()
+
+    mock_response.aiter_bytes = aiter_bytes
+
+    mock_client_instance = MagicMock(spec=AsyncClient)
+    mock_client_instance.stream.return_value.__aenter__.return_value = mock_response
+    return mock_client_instance
+
 
 class TestExtractionServiceIntegration:
     """Integration tests for ExtractionService."""
@@ -40,26 +85,10 @@ class TestExtractionServiceIntegration:
     async def test_extract_and_classify_mock_http(self, mock_client: AsyncMock) -> None:
         """Test extraction with mocked HTTP client."""
         # Mock HTTP response
-        mock_response = AsyncMock()
-        mock_response.text = """
-        <html>
-            <head><title>Test Page</title></head>
-            <body>
-                <a href="https://example.com/document.pdf">Download PDF</a>
-                <a href="https://youtube.com/watch?v=abc123">Watch Video</a>
-                <a href="https://example.com">Home Page</a>
-            </body>
-        </html>
-        """
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value = _streaming_client(_MOCK_HTML_WITH_LINKS)
 
         # Run extraction
-        result = await self.service.extract_and_classify("https://example.com")
+        result, _ = await self.service.extract_and_classify("https://example.com")
 
         # Verify results
         assert str(result.source_url.value) == "https://example.com/"
@@ -95,14 +124,7 @@ class TestExtractionServiceIntegration:
     async def test_extract_with_storage(self, mock_client: AsyncMock) -> None:
         """Test extraction with result storage."""
         # Mock HTTP response
-        mock_response = AsyncMock()
-        mock_response.text = '<a href="https://example.com/doc.pdf">PDF</a>'
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value = _streaming_client(_MOCK_HTML_PDF_ONLY)
 
         # Mock storage
         with patch.object(
@@ -111,7 +133,7 @@ class TestExtractionServiceIntegration:
             mock_save.return_value = "/tmp/test_output.json"
 
             # Run extraction with storage
-            result = await self.service.extract_and_classify(
+            result, _ = await self.service.extract_and_classify(
                 "https://example.com", save_result=True
             )
 
@@ -124,8 +146,8 @@ class TestExtractionServiceIntegration:
     async def test_extract_http_error_handling(self, mock_client: AsyncMock) -> None:
         """Test handling of HTTP errors."""
         # Mock HTTP error
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.side_effect = ContentExtractionError(
+        mock_client_instance = MagicMock(spec=AsyncClient)
+        mock_client_instance.stream.side_effect = ContentExtractionError(
             "Connection failed",
             ExtractionContext(
                 url="https://example.com",
@@ -133,7 +155,7 @@ class TestExtractionServiceIntegration:
                 start_time=datetime.now(),
             ),
         )
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value = mock_client_instance
 
         # Run extraction and expect error
         with pytest.raises(ContentExtractionError):
@@ -144,20 +166,52 @@ class TestExtractionServiceIntegration:
     async def test_extract_empty_page(self, mock_client: AsyncMock) -> None:
         """Test extraction from page with no links."""
         # Mock HTTP response with no links
-        mock_response = AsyncMock()
-        mock_response.text = "<html><body><p>No links here</p></body></html>"
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = mock_client_instance
+        mock_client.return_value = _streaming_client(_MOCK_HTML_EMPTY)
 
         # Run extraction
-        result = await self.service.extract_and_classify("https://example.com")
+        result, _ = await self.service.extract_and_classify("https://example.com")
 
         # Verify empty results
         assert result.total_links == 0
         assert len(result.pdf_links) == 0
         assert len(result.youtube_links) == 0
         assert len(result.other_links) == 0
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @patch("src.infrastructure.http_client.httpx.AsyncClient")
+    async def test_extract_without_keeping_content(
+        self, mock_client: AsyncMock
+    ) -> None:
+        """Test that raw content is dropped when keep_content is False."""
+        mock_client.return_value = _streaming_client(_MOCK_HTML_PDF_ONLY)
+
+        result, content = await self.service.extract_and_classify(
+            "https://example.com", keep_content=False
+        )
+
+        assert content == ""
+        assert result.total_links == 1
+        assert self.link_parser._last_parse is None
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    @patch("src.infrastructure.http_client.httpx.AsyncClient")
+    async def test_extract_with_lexbor_parser(self, mock_client: AsyncMock) -> None:
+        """Test that the selectolax parser yields the same result end to end."""
+        pytest.importorskip("selectolax.lexbor")
+        from src.infrastructure.lexbor_parser import LexborLinkParser
+
+        mock_client.return_value = _streaming_client(_MOCK_HTML_MIXED)
+        lexbor_service = ExtractionService(
+            content_extractor=self.http_client,
+            link_parser=LexborLinkParser(),
+            link_classifier=self.link_classifier,
+            result_storage=self.storage,
+        )
+
+        expected, _ = await self.service.extract_and_classify("https://example.com")
+        result, _ = await lexbor_service.extract_and_classify("https://example.com")
+
+        assert result.total_links == expected.total_links == 4
+        assert result.pdf_links == expected.pdf_links
+        assert result.youtube_links == expected.youtube_links
+        assert result.other_links == expected.other_links
@@ -0,0 +1,100 @@
+"""
+Unit tests for the command-line interface helpers.
+"""
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.cli import _extract
+from src.core.exceptions import ContentExtractionError, ExtractionContext
+from src.core.value_objects import CorrelationId
+
+_PAGE_HTML = b'<html><body><a href="/about">About</a></body></html>'
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """Serve the same small HTML page for every GET."""
+
+    def do_GET(self) -> None:
+        """Respond with the page."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(_PAGE_HTML)))
+        self.end_headers()
+        self.wfile.write(_PAGE_HTML)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep test output quiet."""
+
+
+@pytest.fixture  # type: ignore[misc]
+def page_url() -> Iterator[str]:
+    """Run a local HTTP server for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestExtractHelper:
+    """Test that CLI runs release their HTTP client."""
+
+    @pytest.fixture(autouse=True)  # type: ignore[misc]
+    def _in_tmp_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Keep the output/ files the helpers write out of the repository."""
+        monkeypatch.chdir(tmp_path)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_extract_closes_aiohttp_session(self, page_url: str) -> None:
+        """Test that the aiohttp session is closed when extraction finishes."""
+        pytest.importorskip("aiohttp")
+        from src.infrastructure.aiohttp_client import AiohttpHttpClient
+
+        sessions = []
+        get_session = AiohttpHttpClient._get_session
+
+        def recording_get_session(self: AiohttpHttpClient) -> object:
+            session = get_session(self)
+            sessions.append(session)
+            return session
+
+        with patch("src.infrastructure.http_client.settings") as mock_settings, patch(
+            "src.infrastructure.html_parser.settings"
+        ) as mock_parser_settings, patch.object(
+            AiohttpHttpClient, "_get_session", recording_get_session
+        ):
+            mock_settings.http_client = "aiohttp"
+            mock_parser_settings.html_parser = "beautifulsoup"
+            result = await _extract(page_url)
+
+        assert result.total_links == 1
+        assert sessions
+        assert all(session.closed for session in sessions)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_extract_closes_client_on_error(self) -> None:
+        """Test that the client is closed even when fetching fails."""
+        http_client = AsyncMock()
+        http_client.extract_content.side_effect = ContentExtractionError(
+            "unreachable",
+            ExtractionContext(
+                url="https://example.com",
+                correlation_id=CorrelationId.generate(),
+                start_time=datetime.now(),
+            ),
+        )
+
+        with patch("src.cli.create_content_extractor", return_value=http_client):
+            with pytest.raises(ContentExtractionError):
+                await _extract("https://example.com")
+
+        http_client.aclose.assert_awaited_once()
@@ -11,6 +11,7 @@ from src.core.models import (
     ExtractionMetadata,
     ExtractionResult,
     LinkType,
+    bucket_by_type,
 )
 from src.core.value_objects import CorrelationId, ProcessingTime, SourceUrl
 
@@ -66,6 +67,30 @@ class TestExtractedLink:
         assert link.link_text == "Test Link"
 
 
+class TestBucketByType:
+    """Test bucket_by_type helper."""
+
+    def test_buckets_links_in_order(self) -> None:
+        """Test links are grouped by type preserving order."""
+        links = [
+            ExtractedLink(
+                url="https://example.com/a.pdf", link_text="A", link_type=LinkType.PDF
+            ),
+            ExtractedLink(
+                url="https://example.com", link_text="Home", link_type=LinkType.OTHER
+            ),
+            ExtractedLink(
+                url="https://example.com/b.pdf", link_text="B", link_type=LinkType.PDF
+            ),
+        ]
+
+        buckets = bucket_by_type(links)
+
+        assert [link.link_text for link in buckets[LinkType.PDF]] == ["A", "B"]
+        assert buckets[LinkType.YOUTUBE] == []
+        assert [link.link_text for link in buckets[LinkType.OTHER]] == ["Home"]
+
+
 class TestExtractionMetadata:
     """Test ExtractionMetadata model."""
 
@@ -1,15 +1,29 @@
 """
 Unit tests for infrastructure components.
 """
+import asyncio
+import csv
+import io
+import tempfile
+from collections.abc import AsyncIterator
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import pytest
+from bs4 import BeautifulSoup
 
+from src.core.exceptions import ContentExtractionError
 from src.core.models import ExtractedLink, ExtractionResult, LinkType, SourceUrl
+from src.infrastructure.context_classifier import ContextAwareClassifier
 from src.infrastructure.formatters import OutputFormatters
-from src.infrastructure.html_parser import BeautifulSoupLinkParser
-from src.infrastructure.link_classifier import RegexLinkClassifier
+from src.infrastructure.html_parser import (
+    BeautifulSoupLinkParser,
+    create_link_parser,
+)
+from src.infrastructure.http_client import AsyncHttpClient, create_content_extractor
+from src.infrastructure.link_classifier import RegexLinkClassifier, _classify_link
+from src.infrastructure.link_parsing import filter_navigation_hrefs
 from src.infrastructure.local_storage import LocalFileStorage
 
 
@@ -73,6 +87,207 @@ class TestBeautifulSoupLinkParser:
         assert links[0][0] == "https://example.com"
         assert links[0][1] == "https://example.com"  # Falls back to URL
 
+    def test_parse_links_single_text_node(self) -> None:
+        """Test that plain-text anchors read the same as via get_text."""
+        html_content = """
+        <a href="/a">  Tom &amp; Jerry  </a>
+        <a href="/b"><!-- hidden --></a>
+        <a href="/c">Nested <b>bold</b></a>
+        """
+
+        links = self.parser.parse_links(html_content, "https://example.com")
+
+        assert [text for _, text in links] == ["Tom & Jerry", "/b", "Nestedbold"]
+
+    def test_parse_links_embedded_elements_in_document_order(self) -> None:
+        """Test that anchors, iframes, objects and embeds are collected in order."""
+        html_content = """
+        <iframe src="https://player.example.com/1" title="Player"></iframe>
+        <a href="/page">Page</a>
+        <object data="/files/doc.pdf"></object>
+        <embed src="/media/clip.swf">
+        """
+
+        links = self.parser.parse_links(html_content, "https://example.com")
+
+        assert links == [
+            ("https://player.example.com/1", "Player"),
+            ("https://example.com/page", "Page"),
+            ("https://example.com/files/doc.pdf", "Embedded Object"),
+            ("https://example.com/media/clip.swf", "Embedded Content"),
+        ]
+
+    def test_parse_links_absolute_urls_match_urljoin(self) -> None:
+        """Test absolute hrefs resolve exactly as urljoin would."""
+        html_content = """
+        <a href="https://other.com/a/b?c=1">Absolute</a>
+        <a href="https://other.com/empty?">Empty query</a>
+        """
+
+        links = self.parser.parse_links(html_content, "https://example.com/x/")
+
+        assert [url for url, _ in links] == [
+            "https://other.com/a/b?c=1",
+            "https://other.com/empty",
+        ]
+
+    def test_parse_links_strip_tabs_and_newlines_like_urljoin(self) -> None:
+        """Test absolute hrefs containing tabs or newlines are cleaned."""
+        html_content = (
+            '<a href="https://other.com/x\ny">Newline</a>'
+            '<a href="https://other.com/x\ty">Tab</a>'
+            '<a href="https://other.com/x\r\ny">CRLF</a>'
+        )
+
+        links = self.parser.parse_links(html_content, "https://example.com/")
+
+        assert [url for url, _ in links] == ["https://other.com/xy"] * 3
+
+    def test_find_navigation_links(self) -> None:
+        """Test that only same-site, non-download pages are crawl targets."""
+        html_content = """
+        <a href="/about">About</a>
+        <a href="https://example.com/contact">Contact</a>
+        <a href="https://other.com/page">External</a>
+        <a href="/files/report.pdf">Report</a>
+        <a href="#top">Top</a>
+        <a href="mailto:info@example.com">Mail</a>
+        <a href="javascript:void(0)">JS</a>
+        """
+
+        links = self.parser.find_navigation_links(
+            html_content, "https://example.com/index.html"
+        )
+
+        assert sorted(links) == [
+            "https://example.com/about",
+            "https://example.com/contact",
+        ]
+
+    def test_find_navigation_links_skips_malformed_href(self) -> None:
+        """Test that one unparseable href does not abort the page."""
+        html_content = """
+        <a href="//[bad/x">Bad</a>
+        <a href="/about">About</a>
+        """
+
+        links = self.parser.find_navigation_links(html_content, "https://example.com/")
+
+        assert links == ["https://example.com/about"]
+
+    def test_parse_reused_for_navigation_links(self) -> None:
+        """Test that the same content string is only parsed once."""
+        html_content = '<a href="/about">About</a>'
+
+        with patch(
+            "src.infrastructure.html_parser.BeautifulSoup",
+            wraps=BeautifulSoup,
+        ) as mock_soup:
+            links = self.parser.parse_links(html_content, "https://example.com")
+            nav_links = self.parser.find_navigation_links(
+                html_content, "https://example.com"
+            )
+
+        assert links == [("https://example.com/about", "About")]
+        assert nav_links == ["https://example.com/about"]
+        assert mock_soup.call_count == 1
+
+    def test_navigation_links_release_cached_parse(self) -> None:
+        """Test that the parsed page is not kept after navigation links."""
+        html_content = '<a href="/about">About</a>'
+
+        self.parser.parse_links(html_content, "https://example.com")
+        assert self.parser._last_parse is not None
+
+        self.parser.find_navigation_links(html_content, "https://example.com")
+        assert self.parser._last_parse is None
+
+
+class TestFilterNavigationHrefs:
+    """Test the navigation href filter shared by the parser backends."""
+
+    def test_keeps_same_site_pages(self) -> None:
+        """Test that only resolvable same-site, non-download pages are kept."""
+        hrefs = [
+            "/about",
+            None,
+            "",
+            "#top",
+            "mailto:info@example.com",
+            "/files/report.pdf",
+            "https://other.com/page",
+            "//[bad/x",
+            "https://example.com/about",
+        ]
+
+        links = filter_navigation_hrefs(hrefs, "https://example.com/index.html")
+
+        assert links == ["https://example.com/about"]
+
+
+class TestLexborLinkParser:
+    """Test selectolax-backed HTML link parser."""
+
+    html_content = """
+    <html>
+        <body>
+            <iframe src="https://www.youtube.com/embed/abc" title="Player"></iframe>
+            <a href="/page"> Page <b>One</b> </a>
+            <a href="https://example.com/files/report.pdf.pdf">Report.pdf.pdf</a>
+            <a href="/download/1" download="notes.pdf">Notes</a>
+            <a href="/empty"></a>
+            <a href="javascript:void(0)">JS</a>
+            <a href="#top">Top</a>
+            <object data="/files/doc.pdf"></object>
+            <embed src="/media/clip.swf">
+            <a href="https://other.com/page">External</a>
+        </body>
+    </html>
+    """
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        pytest.importorskip("selectolax.lexbor")
+        from src.infrastructure.lexbor_parser import LexborLinkParser
+
+        self.parser = LexborLinkParser()
+        self.reference = BeautifulSoupLinkParser()
+
+    def test_parse_links_matches_beautifulsoup(self) -> None:
+        """Test that links and texts match the BeautifulSoup parser."""
+        base_url = "https://example.com/docs/"
+
+        assert self.parser.parse_links(
+            self.html_content, base_url
+        ) == self.reference.parse_links(self.html_content, base_url)
+
+    def test_find_navigation_links_matches_beautifulsoup(self) -> None:
+        """Test that navigation links match the BeautifulSoup parser."""
+        base_url = "https://example.com/docs/"
+
+        assert sorted(
+            self.parser.find_navigation_links(self.html_content, base_url)
+        ) == sorted(self.reference.find_navigation_links(self.html_content, base_url))
+
+    def test_find_navigation_links_skips_malformed_href(self) -> None:
+        """Test that one unparseable href does not abort the page."""
+        html_content = '<a href="//[bad/x">Bad</a><a href="/about">About</a>'
+
+        links = self.parser.find_navigation_links(html_content, "https://example.com/")
+
+        assert links == ["https://example.com/about"]
+
+    def test_create_link_parser_selects_backend(self) -> None:
+        """Test that the html_parser setting picks the parser backend."""
+        from src.infrastructure.lexbor_parser import LexborLinkParser
+
+        with patch("src.infrastructure.html_parser.settings") as mock_settings:
+            mock_settings.html_parser = "lexbor"
+            assert isinstance(create_link_parser(), LexborLinkParser)
+
+            mock_settings.html_parser = "beautifulsoup"
+            assert isinstance(create_link_parser(), BeautifulSoupLinkParser)
+
 
 class TestRegexLinkClassifier:
     """Test link classifier."""
@@ -138,6 +353,168 @@ class TestRegexLinkClassifier:
         assert classified[1].link_type == LinkType.YOUTUBE
         assert classified[2].link_type == LinkType.OTHER
 
+    def test_classify_pdf_url_patterns(self) -> None:
+        """Test the download and last-segment PDF URL patterns."""
+        links = [
+            ("https://example.com/notes.pdf/get?action=download", "Notes"),
+            ("https://example.com/files/notes.pdf.html", "Notes"),
+            ("https://example.com/notes.pdfs/index", "Notes"),
+        ]
+
+        classified = self.classifier.classify_links(links)
+
+        assert [link.link_type for link in classified] == [
+            LinkType.PDF,
+            LinkType.PDF,
+            LinkType.OTHER,
+        ]
+        # Repeated ".pdf" used to backtrack quadratically. Such URLs fail
+        # ExtractedLink validation, but only after being classified.
+        long_url = "https://example.com/" + "a.pdfx" * 5000 + "/"
+        assert _classify_link(long_url, "Page") == LinkType.OTHER
+
+    def test_classification_is_cached(self) -> None:
+        """Test repeated links are classified from the module-level cache."""
+        _classify_link.cache_clear()
+        links = [("https://example.com/guide.pdf", "Guide")]
+
+        classified = self.classifier.classify_links(links)
+        classified += self.classifier.classify_links(links)
+        classified += RegexLinkClassifier().classify_links(links)
+
+        assert all(link.link_type == LinkType.PDF for link in classified)
+        cache_info = _classify_link.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
+    def test_repeated_links_are_copied(self) -> None:
+        """Test repeats within one call are equal but independent links."""
+        links = [
+            ("https://example.com/nav", "Home"),
+            ("https://example.com/doc.pdf", "Doc"),
+            ("https://example.com/nav", "Home"),
+        ]
+
+        classified = self.classifier.classify_links(links)
+
+        assert len(classified) == 3
+        assert classified[2] == classified[0]
+        assert classified[2] is not classified[0]
+
+
+class TestContextAwareClassifier:
+    """Test context-aware link classifier."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.classifier = ContextAwareClassifier()
+
+    def test_cache_stats_follow_structlog_level(self) -> None:
+        """Test that cache statistics are gathered only when debug is on."""
+        links = [("https://example.com/page", "Page")]
+
+        for debug_enabled in (False, True):
+            with patch(
+                "src.infrastructure.context_classifier.logger"
+            ) as mock_logger, patch.object(
+                self.classifier,
+                "_classify_cached",
+                wraps=self.classifier._classify_cached,
+            ) as mock_classify:
+                mock_logger.is_enabled_for.return_value = debug_enabled
+                self.classifier.classify_links(links)
+
+            assert mock_classify.cache_info.called is debug_enabled
+            assert mock_logger.debug.called is debug_enabled
+
+    def test_classify_by_url_patterns(self) -> None:
+        """Test classification driven by URL patterns."""
+        links = [
+            ("https://example.com/guide.PDF", "Guide"),
+            ("https://example.com/file.pdf?dl=1", "File"),
+            ("https://youtu.be/xyz789", "Clip"),
+            ("https://www.youtube-nocookie.com/embed/abc", "Embed"),
+            ("https://cdn.iframe.ly/CXHbSqy", "Player"),
+            ("https://example.com/about", "About"),
+        ]
+
+        classified = self.classifier.classify_links(links)
+
+        assert [link.link_type for link in classified] == [
+            LinkType.PDF,
+            LinkType.PDF,
+            LinkType.YOUTUBE,
+            LinkType.YOUTUBE,
+            LinkType.YOUTUBE,
+            LinkType.OTHER,
+        ]
+
+    def test_classify_by_text_context(self) -> None:
+        """Test classification falling back to link text hints."""
+        links = [
+            ("https://example.com/files/123", "Syllabus (3 MB pdf)"),
+            ("https://example.com/media/1", "Watch the intro"),
+        ]
+
+        classified = self.classifier.classify_links(links)
+
+        assert classified[0].link_type == LinkType.PDF
+        assert classified[1].link_type == LinkType.YOUTUBE
+
+    def test_classify_size_hint_on_same_line(self) -> None:
+        """Test that a size hint needs "pdf" after it on the same line."""
+        links = [
+            ("https://example.com/files/1", "Slides 2 MB\nNotes (1 MB PDF)"),
+            ("https://example.com/files/2", "Slides 2 MB\npdf"),
+            # Repeated sizes used to backtrack quadratically
+            ("https://example.com/files/3", "1MB " * 5000),
+        ]
+
+        classified = self.classifier.classify_links(links)
+
+        assert [link.link_type for link in classified] == [
+            LinkType.PDF,
+            LinkType.OTHER,
+            LinkType.OTHER,
+        ]
+
+    def test_classify_iframely_proxy(self) -> None:
+        """Test iframe.ly proxies wrapping a YouTube URL."""
+        links = [
+            (
+                "https://iframe.ly/api/oembed?url=https://youtu.be/abc123",
+                "Embedded",
+            ),
+            ("https://iframe.ly/api/oembed?url=https://vimeo.com/1", "Embedded"),
+        ]
+
+        classified = self.classifier.classify_links(links)
+
+        assert classified[0].link_type == LinkType.YOUTUBE
+        assert classified[1].link_type == LinkType.OTHER
+
+    def test_classification_is_cached(self) -> None:
+        """Test repeated links are classified from the cache."""
+        links = [("https://example.com/guide.pdf", "Guide")]
+
+        classified = self.classifier.classify_links(links)
+        classified += self.classifier.classify_links(links)
+        classified += self.classifier.classify_links(links)
+
+        assert all(link.link_type == LinkType.PDF for link in classified)
+        cache_info = self.classifier._classify_cached.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
+    def test_repeated_links_are_copied(self) -> None:
+        """Test repeats within one call are equal but independent links."""
+        links = [("https://example.com/nav", "Home")] * 2
+
+        classified = self.classifier.classify_links(links)
+
+        assert classified[1] == classified[0]
+        assert classified[1] is not classified[0]
+
 
 class TestOutputFormatters:
     """Test output formatters."""
@@ -203,8 +580,17 @@ class TestOutputFormatters:
 
         lines = formatted.split("\n")
         assert lines[0] == "Type,Text,URL"
-        assert 'PDF,"Document",https://example.com/doc.pdf' in lines
-        assert 'YouTube,"Video",https://youtube.com/watch?v=123' in lines
+        assert "PDF,Document,https://example.com/doc.pdf" in lines
+        assert "YouTube,Video,https://youtube.com/watch?v=123" in lines
+
+    def test_format_csv_escapes_link_text(self) -> None:
+        """Test CSV quoting of link text containing commas and quotes."""
+        self.result.pdf_links[0].link_text = 'Report, "final"'
+
+        formatted = self.formatter.format_result(self.result, "csv")
+
+        rows = list(csv.reader(io.StringIO(formatted)))
+        assert rows[1] == ["PDF", 'Report, "final"', "https://example.com/doc.pdf"]
 
     def test_unsupported_format(self) -> None:
         """Test handling of unsupported format."""
@@ -219,9 +605,14 @@ class TestLocalFileStorage:
 
     def setup_method(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = Path("/tmp/test_output")
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = Path(self._temp_dir.name)
         self.storage = LocalFileStorage(self.temp_dir)
 
+    def teardown_method(self) -> None:
+        """Remove the test output directory."""
+        self._temp_dir.cleanup()
+
     @pytest.mark.asyncio  # type: ignore[misc]
     async def test_save_result(self) -> None:
         """Test saving result to file."""
@@ -233,7 +624,9 @@ class TestLocalFileStorage:
         )
 
         # Mock the file operations
-        with patch("builtins.open", create=True) as mock_open:
+        with patch("builtins.open", create=True) as mock_open, patch(
+            "os.replace"
+        ) as mock_replace:
             mock_file = Mock()
             mock_open.return_value.__enter__.return_value = mock_file
 
@@ -241,6 +634,10 @@ class TestLocalFileStorage:
 
             assert file_path.endswith("test.json")
             mock_file.write.assert_called_once()
+            tmp_path, target = mock_replace.call_args.args
+            assert target == self.temp_dir / "test.json"
+            assert tmp_path.name.startswith("test.json.")
+            assert tmp_path.name.endswith(".tmp")
 
     @pytest.mark.asyncio  # type: ignore[misc]
     async def test_save_result_auto_filename(self) -> None:
@@ -252,7 +649,7 @@ class TestLocalFileStorage:
             other_links=[],
         )
 
-        with patch("builtins.open", create=True) as mock_open:
+        with patch("builtins.open", create=True) as mock_open, patch("os.replace"):
             mock_file = Mock()
             mock_open.return_value.__enter__.return_value = mock_file
 
@@ -263,8 +660,8 @@ class TestLocalFileStorage:
             mock_file.write.assert_called_once()
 
     @pytest.mark.asyncio  # type: ignore[misc]
-    async def test_save_result_with_existing_file(self) -> None:
-        """Test saving result when file already exists (should retry with new name)."""
+    async def test_save_result_auto_filenames_are_unique(self) -> None:
+        """Test that back-to-back saves never generate the same filename."""
         result = ExtractionResult(
             source_url=SourceUrl.from_string("https://example.com"),
             pdf_links=[],
@@ -272,33 +669,31 @@ class TestLocalFileStorage:
             other_links=[],
         )
 
-        # Simulate file existing by making open raise FileExistsError once
-        with patch("builtins.open") as mock_open, patch(
-            "pathlib.Path.exists", return_value=True
-        ), patch("pathlib.Path.mkdir"):
-            # Create a mock file object that supports context manager protocol
-            mock_file_instance_for_write = (
-                Mock()
-            )  # This will be the 'f' in 'with open(...) as f:'
-            mock_file_succeed_instance = (
-                MagicMock()
-            )  # This mocks the open() call itself
-            mock_file_succeed_instance.__enter__.return_value = (
-                mock_file_instance_for_write
-            )
+        with patch("builtins.open", create=True), patch("os.replace"):
+            file_paths = [await self.storage.save_result(result) for _ in range(3)]
 
-            # Simulate the initial file already existing, then succeed on retry
-            mock_open.side_effect = [
-                FileExistsError,  # First attempt raises FileExistsError
-                mock_file_succeed_instance,  # Second attempt returns a mock that can be entered
-            ]
+        assert len(set(file_paths)) == 3
+        assert all("extraction_example.com_" in path for path in file_paths)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_save_result_replaces_file_atomically(
+        self, temp_output_dir: Path
+    ) -> None:
+        """Test that saving overwrites via rename and leaves no temporary file."""
+        result = ExtractionResult(
+            source_url=SourceUrl.from_string("https://example.com"),
+            pdf_links=[],
+            youtube_links=[],
+            other_links=[],
+        )
+        storage = LocalFileStorage(temp_output_dir)
+        (temp_output_dir / "result.json").write_text("stale")
 
-            file_path = await self.storage.save_result(result, "existing.json")
+        file_path = await storage.save_result(result, "result.json")
 
-            # Expect a new filename with timestamp appended
-            assert "existing_" in file_path and file_path.endswith(".json")
-            assert mock_open.call_count == 2
-            mock_file_instance_for_write.write.assert_called_once()  # Verify write on the inner mock
+        saved = ExtractionResult.model_validate_json(Path(file_path).read_bytes())
+        assert saved == result
+        assert [p.name for p in temp_output_dir.iterdir()] == ["result.json"]
 
     @pytest.mark.asyncio  # type: ignore[misc]
     async def test_ensure_directory_exists(self) -> None:
@@ -308,10 +703,333 @@ class TestLocalFileStorage:
         mock_path_exists = Mock(return_value=False)
         mock_path_mkdir = Mock()
 
+        # setup_method already created temp_dir, so use a fresh path
         with patch("pathlib.Path.exists", mock_path_exists), patch(
             "pathlib.Path.mkdir", mock_path_mkdir
         ):
-            LocalFileStorage(self.temp_dir)
+            LocalFileStorage(self.temp_dir / "new")
             # The __init__ method calls _ensure_directory_exists
             # mock_path_exists.assert_called_once_with() # Removed this assertion
             mock_path_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
+    def test_ensure_directory_exists_only_once(self) -> None:
+        """Test that repeated construction does not recreate the directory."""
+        with patch("pathlib.Path.mkdir") as mock_path_mkdir:
+            LocalFileStorage(self.temp_dir)
+            LocalFileStorage(self.temp_dir)
+
+            mock_path_mkdir.assert_not_called()
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_save_result_recreates_removed_directory(self) -> None:
+        """Test that a directory deleted after construction is created again."""
+        output_dir = self.temp_dir / "removed"
+        storage = LocalFileStorage(output_dir)
+        output_dir.rmdir()
+        result = ExtractionResult(
+            source_url=SourceUrl.from_string("https://example.com"),
+            pdf_links=[],
+            youtube_links=[],
+            other_links=[],
+        )
+
+        file_path = await storage.save_result(result, "result.json")
+
+        assert Path(file_path).parent == output_dir
+        assert Path(file_path).is_file()
+
+
+class TestAsyncHttpClient:
+    """Test httpx-backed HTTP client."""
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_instances_share_client(self) -> None:
+        """Test that instances on one event loop reuse a single httpx client."""
+        first = AsyncHttpClient(timeout=5.0)
+        second = AsyncHttpClient(timeout=5.0)
+
+        client = first._get_client()
+        try:
+            assert second._get_client() is client
+        finally:
+            await first.aclose()
+
+        assert client.is_closed
+        assert second._get_client() is not client
+        await second.aclose()
+
+    async def _extract_with(
+        self, client: AsyncHttpClient, response: httpx.Response
+    ) -> str:
+        """Run extract_content against a transport that always returns response."""
+        transport = httpx.MockTransport(lambda request: response)
+        async with httpx.AsyncClient(transport=transport) as mock_client:
+            with patch.object(client, "_get_client", return_value=mock_client):
+                return await client.extract_content("https://example.com")
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_extract_content_uses_declared_charset(self) -> None:
+        """Test that the body is decoded with the charset from Content-Type."""
+        response = httpx.Response(
+            200,
+            headers={"Content-Type": "text/html; charset=latin-1"},
+            content="<p>café</p>".encode("latin-1"),
+        )
+
+        content = await self._extract_with(AsyncHttpClient(), response)
+
+        assert content == "<p>café</p>"
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_declared_oversized_body_rejected(self) -> None:
+        """Test that a Content-Length over the limit is refused."""
+        response = httpx.Response(200, content=b"x" * 100)
+
+        with pytest.raises(ContentExtractionError, match="exceeds 50 bytes"):
+            await self._extract_with(AsyncHttpClient(max_body_bytes=50), response)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_streamed_oversized_body_rejected(self) -> None:
+        """Test that a chunked body growing past the limit is refused."""
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for _ in range(10):
+                yield b"x" * 10
+
+        # An async iterable body is sent chunked, without a Content-Length
+        response = httpx.Response(200, content=chunks())
+
+        with pytest.raises(ContentExtractionError, match="exceeds 50 bytes"):
+            await self._extract_with(AsyncHttpClient(max_body_bytes=50), response)
+
+    async def _count_attempts(self, error: httpx.TimeoutException) -> int:
+        """Return how many requests extract_content sends before giving up."""
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            raise error
+
+        client = AsyncHttpClient(max_retries=3)
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as mock_client:
+            with patch.object(client, "_get_client", return_value=mock_client), patch(
+                "src.infrastructure.http_client._backoff_delay", return_value=0
+            ):
+                with pytest.raises(ContentExtractionError, match="Timeout"):
+                    await client.extract_content("https://example.com")
+        return attempts
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_read_timeout_retried(self) -> None:
+        """Test that read timeouts are retried up to max_retries."""
+        assert await self._count_attempts(httpx.ReadTimeout("slow")) == 3
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_connect_timeout_not_retried_again(self) -> None:
+        """Test that connect timeouts, retried by the transport, fail at once."""
+        assert await self._count_attempts(httpx.ConnectTimeout("down")) == 1
+
+
+class TestAiohttpHttpClient:
+    """Test aiohttp-backed HTTP client."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        pytest.importorskip("aiohttp")
+        from src.infrastructure.aiohttp_client import AiohttpHttpClient
+
+        self.client = AiohttpHttpClient(timeout=5.0, max_retries=1)
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_extract_content(self) -> None:
+        """Test that the decoded body is returned."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.get_encoding.return_value = "utf-8"
+
+        async def iter_chunked(size: int) -> AsyncIterator[bytes]:
+            yield b"<html>ok</html>"
+
+        mock_response.content.iter_chunked = iter_chunked
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+
+        with patch.object(self.client, "_get_session", return_value=mock_session):
+            content = await self.client.extract_content("https://example.com")
+
+        assert content == "<html>ok</html>"
+        mock_response.raise_for_status.assert_called_once()
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_http_error_raises_extraction_error(self) -> None:
+        """Test that error statuses surface as ContentExtractionError."""
+        import aiohttp
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            MagicMock(), (), status=404
+        )
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+
+        with patch.object(self.client, "_get_session", return_value=mock_session):
+            with pytest.raises(ContentExtractionError, match="HTTP error 404"):
+                await self.client.extract_content("https://example.com")
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_declared_oversized_body_rejected(self) -> None:
+        """Test that a Content-Length over the limit is refused unread."""
+        self.client.max_body_bytes = 50
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Length": "100"}
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+
+        with patch.object(self.client, "_get_session", return_value=mock_session):
+            with pytest.raises(ContentExtractionError, match="exceeds 50 bytes"):
+                await self.client.extract_content("https://example.com")
+
+        mock_response.content.iter_chunked.assert_not_called()
+
+    def test_create_content_extractor_selects_backend(self) -> None:
+        """Test that the http_client setting picks the HTTP client backend."""
+        from src.infrastructure.aiohttp_client import AiohttpHttpClient
+
+        with patch("src.infrastructure.http_client.settings") as mock_settings:
+            mock_settings.http_client = "aiohttp"
+            assert isinstance(create_content_extractor(), AiohttpHttpClient)
+
+            mock_settings.http_client = "httpx"
+            assert isinstance(create_content_extractor(), AsyncHttpClient)
+
+
+class TestAzureBlobStorage:
+    """Test Azure Blob Storage against a mocked container client."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        pytest.importorskip("azure.storage.blob")
+        from azure.storage.blob.aio import BlobClient, ContainerClient
+
+        from src.infrastructure import cloud_storage
+
+        self.cloud_storage = cloud_storage
+        cloud_storage._container_clients.clear()
+        # Blob name -> mocked blob client that uploaded it
+        self.blob_clients: dict[str, MagicMock] = {}
+
+        def container_client() -> MagicMock:
+            container = MagicMock(spec=ContainerClient)
+            container.exists.return_value = False
+
+            def get_blob_client(name: str) -> MagicMock:
+                blob_client = MagicMock(spec=BlobClient)
+                blob_client.url = f"https://account.blob/results/{name}"
+                self.blob_clients[name] = blob_client
+                return blob_client
+
+            container.get_blob_client.side_effect = get_blob_client
+            return container
+
+        self._patcher = patch.object(
+            cloud_storage.ContainerClient,
+            "from_connection_string",
+            side_effect=lambda *args: container_client(),
+        )
+        self.from_connection_string = self._patcher.start()
+        self.storage = cloud_storage.AzureBlobStorage(
+            connection_string="UseDevelopmentStorage=true", container_name="results"
+        )
+        self.result = ExtractionResult(
+            source_url=SourceUrl.from_string("https://example.com"),
+            pdf_links=[],
+            youtube_links=[],
+            other_links=[],
+        )
+
+    def teardown_method(self) -> None:
+        """Stop patching and drop pooled clients."""
+        self._patcher.stop()
+        self.cloud_storage._container_clients.clear()
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_container_created_once(self) -> None:
+        """Test that the container is checked and created on first save only."""
+        container = self.storage._container_client
+
+        await self.storage.save_result(self.result, "first.json")
+        await self.storage.save_result(self.result, "second.json")
+
+        container.exists.assert_awaited_once()
+        container.create_container.assert_awaited_once()
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_save_result_uploads_json(self) -> None:
+        """Test that a result is uploaded as overwriting JSON."""
+        url = await self.storage.save_result(self.result, "result")
+
+        assert url == "https://account.blob/results/result.json"
+        assert list(self.blob_clients) == ["result.json"]
+        upload = self.blob_clients["result.json"].upload_blob
+        upload.assert_awaited_once()
+        assert upload.await_args.kwargs["overwrite"] is True
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_save_results_uploads_batch(self) -> None:
+        """Test that a batch is uploaded under unique names in input order."""
+        urls = await self.storage.save_results([self.result] * 3)
+
+        names = [url.rsplit("/", 1)[1] for url in urls]
+        assert len(set(names)) == 3
+        assert sorted(self.blob_clients) == sorted(names)
+        assert [name.rsplit("_", 1)[1] for name in names] == [
+            "0.json",
+            "1.json",
+            "2.json",
+        ]
+        self.storage._container_client.create_container.assert_awaited_once()
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_instances_share_client(self) -> None:
+        """Test that instances for one container reuse a single client."""
+        other = self.cloud_storage.AzureBlobStorage(
+            connection_string="UseDevelopmentStorage=true", container_name="results"
+        )
+
+        assert other._container_client is self.storage._container_client
+
+    def test_clients_pooled_per_event_loop(self) -> None:
+        """Test that each event loop gets its own pooled client."""
+
+        async def pooled_client() -> object:
+            return self.storage._container_client
+
+        first = asyncio.run(pooled_client())
+        second = asyncio.run(pooled_client())
+
+        assert first is not second
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_close_container_clients(self) -> None:
+        """Test that shutdown closes pooled clients and later saves reconnect."""
+        await self.storage.save_result(self.result, "before_close.json")
+        closed = self.storage._container_client
+
+        await self.cloud_storage.close_container_clients()
+
+        closed.close.assert_awaited_once()
+        assert not self.cloud_storage._container_clients
+
+        other = self.cloud_storage.AzureBlobStorage(
+            connection_string="UseDevelopmentStorage=true", container_name="results"
+        )
+        await other.save_result(self.result, "after_close.json")
+
+        assert other._container_client is not closed
+        assert list(self.blob_clients) == ["before_close.json", "after_close.json"]
+        closed.get_blob_client.assert_called_once_with("before_close.json")
+        # The replacement client checks the container again
+        other._container_client.exists.assert_awaited_once()